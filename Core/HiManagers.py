@@ -1,30 +1,591 @@
+import asyncio
+import base64
+import copy
+import errno
+import fnmatch
 import hashlib
+import heapq
+import hmac
+import inspect
+import mmap
+import os
+import queue
+import re
 import shutil
+import stat
+import subprocess
+import sys
 import tarfile
 import tempfile
+import threading
+import time
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, wraps
+from operator import attrgetter
 from pathlib import Path
-from typing import Union, List, Optional, Generator, Dict, Any
+from shlex import quote as _q
+from typing import Union, List, Optional, Generator, Dict, Any, Iterable
 
+from Core.console import LogLevel
 from Core.shizuku import Rish
 
+try:
+	# Optional: SIMD and multi-threaded BLAKE3 for hash_type="blake3"
+	import blake3
+except ImportError:
+	blake3 = None
+
+# Keep batched command lines well under Android's ARG_MAX
+_ARG_CHUNK = 64 * 1024
+_STAT_FORMAT = "%n|%s|%F|%U|%G|%a|%Y|%X|%Z"
+# stat %F names mapped to find's %y letters
+_STAT_TYPE_CODES = {
+	"regular file": "f",
+	"regular empty file": "f",
+	"directory": "d",
+	"symbolic link": "l",
+	"character special file": "c",
+	"block special file": "b",
+	"fifo": "p",
+	"socket": "s"
+}
+
+_HASH_BUFFER = 1 << 20
+_ARCHIVE_BUFFER = 1 << 20
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") and "SC_IOV_MAX" in os.sysconf_names else 1024
+# Permission bits <-> octal strings without formatting or parsing per call
+_PERM_STR = [format(i, "03o") for i in range(0o1000)]
+_OCTAL_MODES = {
+	text: int(text, 8)
+	for mode in ("444", "555", "600", "644", "664", "700", "711", "744", "750", "755", "775", "777")
+	for text in (mode, "0" + mode)
+}
+_ZIP_WORKERS = 8
+# Fewer items than this run inline, starting a pool would cost more than it overlaps
+_BULK_MIN_ITEMS = 4
+# Names handled per open parent directory in the *at() batches
+_DIR_FD_BATCH = 256
+# Files at least this big are hashed from a read-only mapping
+_HASH_MMAP_MIN = 8 << 20
+# Integrity checks only; also keeps md5 usable on FIPS-restricted OpenSSL builds (3.9+ keyword)
+_HASH_OPTIONS = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+_HASH_CMDS = {
+	"md5": "md5sum",
+	"sha1": "sha1sum",
+	"sha256": "sha256sum",
+	"sha512": "sha512sum"
+}
+# Core applets no usable BusyBox build leaves out, has_applet answers these without
+# `busybox --list`; base64, free, readlink, the *sum family... are build options and get probed
+_BASE_APPLETS = frozenset({"sh", "test", "true", "cat", "ls", "stat"})
+_ZIP_METHODS = {
+	"stored": zipfile.ZIP_STORED,
+	"deflated": zipfile.ZIP_DEFLATED,
+	"bz2": zipfile.ZIP_BZIP2,
+	"lzma": zipfile.ZIP_LZMA
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):
+	# 3.14+
+	_ZIP_METHODS["zstd"] = zipfile.ZIP_ZSTANDARD
+_PRECOMPRESSED = (
+	".gz", ".tgz", ".xz", ".txz", ".bz2", ".zst", ".lz4", ".zip", ".apk", ".jar",
+	".7z", ".rar", ".jpg", ".jpeg", ".png", ".webp", ".mp3", ".mp4", ".mkv"
+)
+_TAR_COMPRESSION = {
+	"gz": "z", "gzip": "z",
+	"bz2": "j", "bzip2": "j",
+	"xz": "J",
+	"": ""
+}
+
+# Android app seccomp filters may kill the process on copy_file_range, shutil's sendfile path is safe
+_USE_COPY_FILE_RANGE = hasattr(os, "copy_file_range") and not hasattr(sys, "getandroidapilevel")
+_COPY_RANGE_FALLBACK = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF)
+
+
+class _CmdResult:
+	"""Result of a shell command: the persistent session's output or a failure to run it"""
+	__slots__ = ("stdout", "stderr", "returncode")
+
+	def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 1):
+		self.stdout = stdout
+		self.stderr = stderr
+		self.returncode = returncode
+
+	def __repr__(self):
+		return f"_CmdResult(returncode={self.returncode!r}, stdout={self.stdout!r}, stderr={self.stderr!r})"
+
+# Extraction filters exist from 3.12 (and late security releases), 'data' is the upcoming default
+# Old extraction behaviour, spelled out so 3.12+ does not warn about the default
+_TAR_DEFAULT_FILTER = "fully_trusted" if hasattr(tarfile, "data_filter") else None
+
+
+def _numeric_owner(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+	"""tar.add filter storing only uid/gid, like `tar --numeric-owner`"""
+	tarinfo.uname = tarinfo.gname = ""
+	return tarinfo
+
+
+class _NoMtimeTarFile(tarfile.TarFile):
+	"""TarFile that leaves extracted files with their extraction time, one utime() less per member"""
+
+	def utime(self, tarinfo, targetpath):
+		pass
+
+
+def _parse_stat_line(line: str) -> Optional[Dict[str, Any]]:
+	"""One line of `stat -c _STAT_FORMAT` output as an info dict, None for anything else"""
+	parts = line.rsplit('|', 8)
+	if len(parts) != 9:
+		return None
+	name, size, file_type, owner, group, permissions, mtime, atime, ctime = parts
+	code = _STAT_TYPE_CODES.get(file_type.lower())
+	try:
+		return {
+			'name': name,
+			'size': int(size),
+			'type': file_type,
+			'owner': owner,
+			'group': group,
+			'permissions': permissions,
+			'mtime': float(mtime),
+			'atime': float(atime),
+			'ctime': float(ctime),
+			'is_file': code == 'f',
+			'is_dir': code == 'd'
+		}
+	except ValueError:
+		return None
+
+
+# Glob metacharacters, plus simple bracket classes, that must reach the shell unquoted
+_GLOB_TOKEN = re.compile(r"(\*|\?|\[!?[\w.-]+\])")
+
+
+def _q_glob(pattern: str) -> str:
+	"""shlex.quote the literal runs of a glob so only its wildcards expand"""
+	return "".join(part if _GLOB_TOKEN.fullmatch(part) else _q(part)
+				   for part in _GLOB_TOKEN.split(pattern) if part)
+
+
+def _chunk_args(args: List[str], limit: int = _ARG_CHUNK) -> Generator[List[str], None, None]:
+	"""Split already quoted arguments into groups whose joined length stays under limit"""
+	chunk, size = [], 0
+	for arg in args:
+		if chunk and size + len(arg) + 1 > limit:
+			yield chunk
+			chunk, size = [], 0
+		chunk.append(arg)
+		size += len(arg) + 1
+	if chunk:
+		yield chunk
+
+
+_thread_buffers = threading.local()
+# Log queue of the _bulk call a pool thread is currently working for
+_bulk_log = threading.local()
+
+
+def _hash_view() -> memoryview:
+	"""Per-thread hashing buffer, allocated once and reused by every checksum on that thread"""
+	view = getattr(_thread_buffers, "hash_view", None)
+	if view is None:
+		view = _thread_buffers.hash_view = memoryview(bytearray(_HASH_BUFFER))
+	return view
+
+
+def _new_hasher(hash_type: str):
+	"""Fresh hash object, blake3 comes from the optional package and hashes on every core"""
+	if hash_type == "blake3":
+		if blake3 is None:
+			raise ValueError("unsupported hash type blake3 (the blake3 package is not installed)")
+		return blake3.blake3(max_threads=blake3.blake3.AUTO)
+	return hashlib.new(hash_type, **_HASH_OPTIONS)
+
+
+def _file_hasher(path: Union[str, Path], hash_type: str):
+	"""Hash object fed with a local file, hashed in C where hashlib.file_digest exists (3.11+)"""
+	hash_func = _new_hasher(hash_type)
+	if hasattr(hash_func, "update_mmap"):
+		# blake3 0.4+ maps the file itself, no read loop at all
+		hash_func.update_mmap(path)
+		return hash_func
+
+	with open(path, 'rb', buffering=0) as f:
+		if os.fstat(f.fileno()).st_size >= _HASH_MMAP_MIN:
+			try:
+				# One update over the page cache: no copy into a buffer, the GIL is released throughout
+				with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+					hash_func.update(mapped)
+				return hash_func
+			except (OSError, ValueError, OverflowError):
+				# No room in a 32-bit address space, or not mappable; nothing was read yet
+				pass
+
+		if hasattr(hashlib, "file_digest"):
+			return hashlib.file_digest(f, lambda: hash_func)
+
+		update = hash_func.update
+		view = _hash_view()
+		while True:
+			size = f.readinto(view)
+			if not size:
+				return hash_func
+			update(view[:size])
+
+
+def _hash_file(path: Union[str, Path], hash_type: str) -> str:
+	"""Hex digest of a local file"""
+	return _file_hasher(path, hash_type).hexdigest()
+
+
+def _local_checksum(path: str, hash_type: str) -> Optional[str]:
+	"""Hash a file the host can read directly, None when it is out of reach"""
+	try:
+		return _hash_file(path, hash_type)
+	except (OSError, ValueError):
+		return None
+
+
+def _local_digest(path: str, hash_type: str) -> Optional[bytes]:
+	"""Raw digest of a file the host can read directly, None when it is out of reach"""
+	try:
+		return _file_hasher(path, hash_type).digest()
+	except (OSError, ValueError):
+		return None
+
+
+def _digest_equal(actual: Union[bytes, str, None], expected_hash: str) -> bool:
+	"""Constant-time digest compare against a hex string, any case; malformed hex never matches"""
+	try:
+		if isinstance(actual, str):
+			actual = bytes.fromhex(actual)
+		return actual is not None and hmac.compare_digest(actual, bytes.fromhex(expected_hash))
+	except ValueError:
+		return False
+
+
+def _as_path(path: Union[str, Path]) -> Path:
+	"""Path of an argument, callers passing a Path already get it back without a rebuild"""
+	return path if isinstance(path, Path) else Path(path)
+
+
+def _try_stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+	"""os.stat that returns None instead of raising"""
+	try:
+		return os.stat(path)
+	except (OSError, ValueError):
+		return None
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path], preserve_metadata: bool = True) -> str:
+	"""shutil.copy2/copy replacement that lets the kernel copy the data with copy_file_range"""
+	global _USE_COPY_FILE_RANGE
+	# One stat of dst answers isdir, exists and samefile; copytree calls this per file
+	dst_stat = _try_stat(dst)
+	if dst_stat is not None and stat.S_ISDIR(dst_stat.st_mode):
+		dst = os.path.join(dst, os.path.basename(src))
+		dst_stat = _try_stat(dst)
+
+	src_stat = os.stat(src)
+	if dst_stat is not None and os.path.samestat(src_stat, dst_stat):
+		raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+	copied = False
+	if not src_stat.st_size and stat.S_ISREG(src_stat.st_mode):
+		# procfs/sysfs files report size 0 too, only a read tells them from empty ones;
+		# the kernel copies below would stop at the reported size either way
+		with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+			_copy_stream(fsrc, fdst)
+		copied = True
+	elif _USE_COPY_FILE_RANGE:
+		try:
+			with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+				infd, outfd = fsrc.fileno(), fdst.fileno()
+				count = min(max(os.fstat(infd).st_size, 1 << 20), 1 << 30)
+				while os.copy_file_range(infd, outfd, count):
+					pass
+			copied = True
+		except OSError as e:
+			if e.errno not in _COPY_RANGE_FALLBACK:
+				raise
+			if e.errno == errno.ENOSYS:
+				_USE_COPY_FILE_RANGE = False
+
+	if not copied:
+		if stat.S_ISFIFO(src_stat.st_mode):
+			raise shutil.SpecialFileError(f"`{src}` is a named pipe")
+		# Userspace copy in 1 MiB pieces, shutil's own fallback reads 64 KiB at a time
+		with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+			_copy_stream(fsrc, fdst)
+	if preserve_metadata:
+		shutil.copystat(src, dst)
+	else:
+		shutil.copymode(src, dst)
+	return dst
+
+
+@lru_cache(maxsize=256)
+def _name_matcher(pattern: str):
+	"""Case-sensitive fnmatch predicate for a single path component, like pathlib's glob on POSIX"""
+	if pattern == "*":
+		# Every entry name is non-empty, skip the regex for the common listing case
+		return bool
+	return re.compile(fnmatch.translate(pattern)).match
+
+
+def _scan_tree(root: Union[str, Path], recursive: bool = True) -> Generator[os.DirEntry, None, None]:
+	"""Yield the entries below root from os.scandir, iteratively and without entering symlinked directories"""
+	stack = [os.fspath(root)]
+	while stack:
+		try:
+			entries = os.scandir(stack.pop())
+		except PermissionError:
+			continue
+		with entries:
+			for entry in entries:
+				if recursive and entry.is_dir(follow_symlinks=False):
+					stack.append(entry.path)
+				yield entry
+
+
+def _zip_member_path(target_dir: Union[str, Path], name: str) -> str:
+	"""Path a member is extracted to, with the same sanitizing as ZipFile.extract"""
+	parts = [part for part in name.split('/') if part not in ('', os.curdir, os.pardir)]
+	return os.path.join(target_dir, *parts)
+
+
+def _extract_zip_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target_dir: Union[str, Path]):
+	"""ZipFile.extract without its per-member path checks and 8 KiB copy loop, parents must exist"""
+	dest = _zip_member_path(target_dir, info.filename)
+	if info.is_dir():
+		os.makedirs(dest, exist_ok=True)
+		return
+	with open(dest, 'wb', buffering=0) as dst:
+		if info.file_size:
+			with zip_ref.open(info) as src:
+				_copy_stream(src, dst, min(info.file_size, _ARCHIVE_BUFFER))
+
+
+def _zip_date_time(mtime: float) -> tuple:
+	"""ZipInfo date_time of an mtime, clamped to what DOS dates hold like strict_timestamps=False"""
+	date_time = time.localtime(mtime)[:6]
+	if date_time[0] < 1980:
+		return 1980, 1, 1, 0, 0, 0
+	if date_time[0] > 2107:
+		return 2107, 12, 31, 23, 59, 59
+	return date_time
+
+
+def _extract_zip_chunk(archive: Union[str, Path], target_dir: Union[str, Path],
+					   infos: List[zipfile.ZipInfo]):
+	"""Extract members through a private ZipFile handle, ZipFile is not thread safe"""
+	with zipfile.ZipFile(archive, 'r') as zip_ref:
+		for info in infos:
+			_extract_zip_member(zip_ref, info, target_dir)
+
+
+def _sorted_entries(path: Union[str, Path], skip_denied: bool = False):
+	"""Iterator over a directory's entries sorted by name, empty for unreadable ones when skip_denied"""
+	try:
+		with os.scandir(path) as entries:
+			return iter(sorted(entries, key=attrgetter("name")))
+	except PermissionError:
+		if not skip_denied:
+			raise
+		return iter(())
+
+
+def _write_file(path: Union[str, Path], data) -> int:
+	"""Replace a file's content with raw os.write calls, no BufferedWriter copy in between"""
+	view = memoryview(data).cast('B')
+	fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+	try:
+		written = 0
+		while written < view.nbytes:
+			written += os.write(fd, view[written:written + _ARCHIVE_BUFFER])
+	finally:
+		os.close(fd)
+	return view.nbytes
+
+
+def _copy_stream(src, dst, size: int = _ARCHIVE_BUFFER):
+	"""copyfileobj that reads into one reused buffer instead of allocating every chunk"""
+	view = memoryview(bytearray(size))
+	while True:
+		read = src.readinto(view)
+		if not read:
+			return
+		dst.write(view[:read])
+
+
+def _parallel_compressor(compression: str) -> Optional[List[str]]:
+	"""pigz/zstd command compressing stdin to stdout on every core, None when not installed"""
+	compression = compression.lower()
+	if compression in ("gz", "gzip") and shutil.which("pigz"):
+		return ["pigz", "-p", str(os.cpu_count() or 1), "-c"]
+	if compression in ("zst", "zstd") and shutil.which("zstd"):
+		return ["zstd", "-T0", "-q", "-c"]
+	return None
+
+
+def _validate_path(default: Any, count: int = 1):
+	"""Reject empty path arguments of an ADBFileManager method and pass them on stripped"""
+	def decorator(func):
+		signature = inspect.signature(func)
+
+		@wraps(func)
+		def wrapper(self, *args, **kwargs):
+			if kwargs:
+				# Paths passed by keyword are checked too, binding puts every one in its place
+				bound = signature.bind(self, *args, **kwargs)
+				args, kwargs = bound.args[1:], bound.kwargs
+			paths = [path.strip() if path else "" for path in args[:count]]
+			if len(paths) < count or not all(paths):
+				self._log_operation(func.__name__, " -> ".join(path or "empty" for path in paths) or "empty",
+									False, "empty path")
+				return list(default) if isinstance(default, list) else default
+			return func(self, *paths, *args[count:], **kwargs)
+		return wrapper
+	return decorator
+
+
+def _ttl_cached(ttl: float, maxsize: int = None):
+	"""Memoize a method per instance and arguments for ttl seconds, keeping at most maxsize entries
+
+	Entries also expire when self._cache_epoch() moves on, callers always get their own copy.
+	None is never stored, a missing path is asked again on the next call. Only writes the
+	instance knows about move the epoch: files changed by PyFManager, downloads, proot or
+	any other process stay unnoticed until the ttl runs out.
+	"""
+	def decorator(func):
+		@wraps(func)
+		def wrapper(self, *args, **kwargs):
+			cache = self.__dict__.setdefault("_ttl_cache", {}).setdefault(func.__name__, {})
+			key = (args, tuple(sorted(kwargs.items())))
+			now = time.monotonic()
+			epoch = self._cache_epoch()
+			hit = cache.pop(key, None)
+			if hit is not None and now - hit[0] < ttl and hit[1] == epoch:
+				cache[key] = hit
+				return copy.copy(hit[2])
+			value = func(self, *args, **kwargs)
+			if value is None:
+				return None
+			cache[key] = (now, epoch, value)
+			if maxsize is not None and len(cache) > maxsize:
+				del cache[next(iter(cache))]
+			return copy.copy(value)
+		return wrapper
+	return decorator
+
+
+class _ShellSession:
+	"""Single long-lived rish shell, commands are framed by an exit-code sentinel"""
+
+	def __init__(self, rish: Rish):
+		self.rish = rish
+		self.process = None
+		self.marker = f"__END_{uuid.uuid4().hex}__"
+		self.lock = threading.Lock()
+
+	def _start(self):
+		self.process = subprocess.Popen(
+			self.rish.loader(),
+			stdin=subprocess.PIPE,
+			stdout=subprocess.PIPE,
+			stderr=subprocess.STDOUT,
+			env=self.rish.env(),
+			text=True,
+			encoding="utf-8",
+			errors="replace"
+		)
+
+	def alive(self) -> bool:
+		return self.process is not None and self.process.poll() is None
+
+	def run(self, command: str, stdin_data: str = None, subshell: bool = True) -> _CmdResult:
+		if stdin_data is not None:
+			# Feed the data through a quoted here-doc, head -c drops the newline the here-doc adds
+			tag = f"__EOF_{uuid.uuid4().hex}__"
+			size = len(stdin_data.encode("utf-8"))
+			newline = "" if stdin_data.endswith("\n") else "\n"
+			command = f"head -c {size} <<'{tag}' | ( {command} )\n{stdin_data}{newline}{tag}"
+
+		with self.lock:
+			if not self.alive():
+				self._start()
+
+			# The subshell keeps `exit`/`cd` and syntax errors from leaking into the session,
+			# stdin is detached so a stray `cat` can't swallow the following commands.
+			# Callers running only builtins on quoted words may skip the subshell's fork.
+			group = f"( eval {_q(command)} )" if subshell else f"{{ eval {_q(command)}; }}"
+			self.process.stdin.write(
+				f"{group} 2>&1 </dev/null; printf '\\n{self.marker}%d\\n' $?\n"
+			)
+			self.process.stdin.flush()
+
+			lines = []
+			while True:
+				line = self.process.stdout.readline()
+				if not line:
+					self.close()
+					raise OSError("rish session closed: " + "".join(lines).strip())
+				if line.startswith(self.marker):
+					returncode = int(line[len(self.marker):].strip() or 1)
+					break
+				lines.append(line)
+
+		output = "".join(lines).rstrip()
+		return _CmdResult(
+			stdout=output if returncode == 0 else "",
+			stderr=output if returncode != 0 else "",
+			returncode=returncode
+		)
+
+	def close(self):
+		if self.process is None:
+			return
+		try:
+			self.process.stdin.close()
+		except OSError:
+			pass
+		if self.process.poll() is None:
+			self.process.kill()
+		self.process.wait()
+		self.process = None
+
 
 class ADBFileManager:
 	def __init__(self, rish: Rish, console_instance):
 		self.rish = rish
 		self.console = console_instance
+		self._session = _ShellSession(rish)
+		# Bumped by every mutating call, lets BusyBoxManager drop queries cached before it
+		self.writes = 0
+
+	def _run_command(self, command: str, timeout: Any = None, stdin_data: str = None,
+					 subshell: bool = True) -> Any:
+		if self._session is not None and timeout is None:
+			try:
+				return self._session.run(command, stdin_data, subshell)
+			except (OSError, ValueError) as e:
+				# Fall back to one process per command for the rest of the run
+				self.console.debug(f"ADB: persistent shell unavailable, falling back - {e}")
+				self._session.close()
+				self._session = None
 
-	def _run_command(self, command: str, timeout: Any = None) -> Any:
 		try:
-			return self.rish.run(command, timeout=timeout)
+			return self.rish.run(command, timeout=timeout, stdin_data=stdin_data)
 		except Exception as e:
-			class MockResult:
-				def __init__(self, error_msg):
-					self.stdout = ""
-					self.stderr = error_msg
-					self.returncode = 1
-			return MockResult(str(e))
+			return _CmdResult(stderr=str(e))
+
+	def _run_argv(self, argv: List[str], stdin_data: str = None, subshell: bool = True) -> Any:
+		# rish always goes through sh, quoting every word is as close to execve as it gets
+		return self._run_command(" ".join(_q(arg) for arg in argv), stdin_data=stdin_data, subshell=subshell)
 
 	def _log_operation(self, operation: str, path: str, success: bool, details: str = ""):
 		status = "✓" if success else "✗"
@@ -33,56 +594,44 @@ class ADBFileManager:
 			message += f" - {details}"
 		self.console.debug(message)
 
+	@_validate_path(False)
 	def exists(self, path: str) -> bool:
-		if not path or not path.strip():
-			self._log_operation("exists", path or "empty", False, "empty path")
-			return False
-
 		try:
-			result = self._run_command(f"test -e {repr(path.strip())} && echo exists || echo missing")
-			success = (result.returncode == 0 and "exists" in (result.stdout or ""))
+			result = self._run_argv(["test", "-e", path], subshell=False)
+			success = result.returncode == 0
 			self._log_operation("exists", path, success)
 			return success
 		except Exception as e:
 			self._log_operation("exists", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(False)
 	def is_file(self, path: str) -> bool:
-		if not path or not path.strip():
-			self._log_operation("is_file", path or "empty", False, "empty path")
-			return False
-
 		try:
-			result = self._run_command(f"test -f {repr(path.strip())} && echo file || echo not_file")
-			success = (result.returncode == 0 and "file" in (result.stdout or ""))
+			result = self._run_argv(["test", "-f", path], subshell=False)
+			success = result.returncode == 0
 			self._log_operation("is_file", path, success)
 			return success
 		except Exception as e:
 			self._log_operation("is_file", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(False)
 	def is_dir(self, path: str) -> bool:
-		if not path or not path.strip():
-			self._log_operation("is_dir", path or "empty", False, "empty path")
-			return False
-
 		try:
-			result = self._run_command(f"test -d {repr(path.strip())} && echo dir || echo not_dir")
-			success = (result.returncode == 0 and "dir" in (result.stdout or ""))
+			result = self._run_argv(["test", "-d", path], subshell=False)
+			success = result.returncode == 0
 			self._log_operation("is_dir", path, success)
 			return success
 		except Exception as e:
 			self._log_operation("is_dir", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(False)
 	def mkdir(self, path: str, parents: bool = False) -> bool:
-		if not path or not path.strip():
-			self._log_operation("mkdir", path or "empty", False, "empty path")
-			return False
-
 		try:
-			cmd = f"mkdir {'-p ' if parents else ''}{repr(path.strip())}"
-			result = self._run_command(cmd)
+			self.writes += 1
+			result = self._run_argv(["mkdir", *(["-p"] if parents else []), "--", path])
 			success = result.returncode == 0
 			self._log_operation("mkdir", path, success, f"parents={parents}")
 			return success
@@ -90,19 +639,16 @@ class ADBFileManager:
 			self._log_operation("mkdir", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(False)
 	def remove(self, path: str, recursive: bool = False, force: bool = False) -> bool:
-		if not path or not path.strip():
-			self._log_operation("remove", path or "empty", False, "empty path")
-			return False
-
 		try:
 			flags = ""
 			if recursive:
 				flags += "r"
 			if force:
 				flags += "f"
-			cmd = f"rm {'-' + flags + ' ' if flags else ''}{repr(path.strip())}"
-			result = self._run_command(cmd)
+			self.writes += 1
+			result = self._run_argv(["rm", *(["-" + flags] if flags else []), "--", path])
 			success = result.returncode == 0
 			self._log_operation("remove", path, success, f"recursive={recursive}, force={force}")
 			return success
@@ -110,14 +656,11 @@ class ADBFileManager:
 			self._log_operation("remove", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(False, count=2)
 	def copy(self, src: str, dst: str, recursive: bool = False) -> bool:
-		if not src or not dst or not src.strip() or not dst.strip():
-			self._log_operation("copy", f"{src} -> {dst}", False, "empty source or destination")
-			return False
-
 		try:
-			cmd = f"cp {'-r ' if recursive else ''}{repr(src.strip())} {repr(dst.strip())}"
-			result = self._run_command(cmd)
+			self.writes += 1
+			result = self._run_argv(["cp", *(["-r"] if recursive else []), "--", src, dst])
 			success = result.returncode == 0
 			self._log_operation("copy", f"{src} -> {dst}", success, f"recursive={recursive}")
 			return success
@@ -125,14 +668,12 @@ class ADBFileManager:
 			self._log_operation("copy", f"{src} -> {dst}", False, f"exception: {e}")
 			return False
 
+	@_validate_path(False)
 	def chmod(self, path: str, mode: str, recursive: bool = False) -> bool:
-		if not path or not path.strip():
-			self._log_operation("chmod", path or "empty", False, "empty path")
-			return False
-
 		try:
-			cmd = f"chmod {'-R ' if recursive else ''}{mode} {repr(path.strip())}"
-			result = self._run_command(cmd)
+			self.writes += 1
+			# str() keeps int modes like 755 working, they were interpolated before argv quoting
+			result = self._run_argv(["chmod", *(["-R"] if recursive else []), str(mode), "--", path])
 			success = result.returncode == 0
 			self._log_operation("chmod", path, success, f"mode={mode}, recursive={recursive}")
 			return success
@@ -140,13 +681,10 @@ class ADBFileManager:
 			self._log_operation("chmod", path, False, f"exception: {e}")
 			return False
 
+	@_validate_path(None)
 	def read(self, path: str) -> Optional[str]:
-		if not path or not path.strip():
-			self._log_operation("read", path or "empty", False, "empty path")
-			return None
-
 		try:
-			result = self._run_command(f"cat {repr(path.strip())}")
+			result = self._run_argv(["cat", "--", path])
 			if result.stdout:
 				success = True
 				content = result.stdout
@@ -160,15 +698,11 @@ class ADBFileManager:
 			self._log_operation("read", path, False, f"exception: {e}")
 			return None
 
+	@_validate_path(False)
 	def write(self, path: str, content: str) -> bool:
-		if not path or not path.strip():
-			self._log_operation("write", path or "empty", False, "empty path")
-			return False
-
 		try:
-			escaped_content = content.replace("'", "'\"'\"'")
-			cmd = f"echo '{escaped_content}' > {repr(path.strip())}"
-			result = self._run_command(cmd)
+			self.writes += 1
+			result = self._run_command(f"cat > {_q(path)}", stdin_data=content)
 			success = result.returncode == 0
 			self._log_operation("write", path, success, f"chars_written={len(content)}")
 			return success
@@ -176,13 +710,51 @@ class ADBFileManager:
 			self._log_operation("write", path, False, f"exception: {e}")
 			return False
 
-	def list_dir(self, path: str) -> List[str]:
-		if not path or not path.strip():
-			self._log_operation("list_dir", path or "empty", False, "empty path")
-			return []
+	def batch_exists(self, paths: List[str]) -> Dict[str, bool]:
+		# One round-trip per chunk, indices keep odd file names out of the parsing
+		found = set()
+		tests = [f"test -e {_q(path)} && echo {i}" for i, path in enumerate(paths) if path.strip()]
+		try:
+			for chunk in _chunk_args(tests):
+				result = self._run_command("; ".join(chunk) + "; true", subshell=False)
+				found.update(int(index) for index in (result.stdout or "").split() if index.isdigit())
+			self._log_operation("batch_exists", f"{len(paths)} paths", True, f"found={len(found)}")
+		except Exception as e:
+			self._log_operation("batch_exists", f"{len(paths)} paths", False, f"exception: {e}")
+		return {path: i in found for i, path in enumerate(paths)}
+
+	@_validate_path(False, count=2)
+	def pull(self, src: str, dst: str) -> bool:
+		try:
+			# Raw bytes of a one-shot `cat` land in dst, nothing passes through the text session
+			with open(dst, "wb") as f:
+				result = self.rish.run_binary(f"cat -- {_q(src)}", stdout=f)
+			success = result.returncode == 0
+			if not success:
+				os.unlink(dst)
+			error = result.stderr.decode("utf-8", "replace").strip()
+			self._log_operation("pull", f"{src} -> {dst}", success, error)
+			return success
+		except (OSError, subprocess.SubprocessError) as e:
+			self._log_operation("pull", f"{src} -> {dst}", False, f"exception: {e}")
+			return False
+
+	@_validate_path(None)
+	def stat_all(self, path: str) -> Optional[Dict[str, Any]]:
+		try:
+			# Existence, type, size, owner and times in one round-trip
+			result = self._run_command(f"stat -c '{_STAT_FORMAT}' -- {_q(path)} 2>/dev/null")
+			info = _parse_stat_line((result.stdout or "").strip()) if result.returncode == 0 else None
+			self._log_operation("stat_all", path, info is not None)
+			return info
+		except Exception as e:
+			self._log_operation("stat_all", path, False, f"exception: {e}")
+			return None
 
+	@_validate_path([])
+	def list_dir(self, path: str) -> List[str]:
 		try:
-			result = self._run_command(f"ls -1 {repr(path.strip())} 2>/dev/null || echo")
+			result = self._run_command(f"ls -1 {_q(path)} 2>/dev/null || echo")
 			output = result.stdout or ""
 			items = [item for item in output.splitlines() if item.strip()]
 			self._log_operation("list_dir", path, True, f"items_count={len(items)}")
@@ -191,31 +763,26 @@ class ADBFileManager:
 			self._log_operation("list_dir", path, False, f"exception: {e}")
 			return []
 
+	@_validate_path(None)
 	def checksum(self, path: str, hash_type: str = "sha512") -> Optional[str]:
-		if not path or not path.strip():
-			self._log_operation("checksum", path or "empty", False, "empty path")
-			return None
-
 		try:
-			result = self._run_command(f"{hash_type}sum {repr(path.strip())} 2>/dev/null")
-			output = result.stdout or ""
-
-			if result.returncode == 0 and output:
-				parts = output.split()
-				if parts:
-					checksum = parts[0]
-					self._log_operation("checksum", path, True, f"type={hash_type}, result={checksum}")
-					return checksum
+			checksum = _local_checksum(path, hash_type)
+			if checksum:
+				self._log_operation("checksum", path, True, f"type={hash_type} (local), result={checksum}")
+				return checksum
 
+			# The md5 fallback runs in the same round-trip, only when the first command fails
+			cmd = f"{hash_type}sum {_q(path)} 2>/dev/null"
 			if hash_type != "md5":
-				result = self._run_command(f"md5sum {repr(path.strip())} 2>/dev/null")
-				output = result.stdout or ""
-				if result.returncode == 0 and output:
-					parts = output.split()
-					if parts:
-						checksum = parts[0]
-						self._log_operation("checksum", path, True, f"type=md5 (fallback), result={checksum}")
-						return checksum
+				cmd += f" || md5sum {_q(path)} 2>/dev/null"
+			result = self._run_command(cmd)
+			parts = (result.stdout or "").split() if result.returncode == 0 else []
+
+			if parts:
+				checksum = parts[0]
+				used = "md5 (fallback)" if hash_type != "md5" and len(checksum) == 32 else hash_type
+				self._log_operation("checksum", path, True, f"type={used}, result={checksum}")
+				return checksum
 
 			self._log_operation("checksum", path, False, f"type={hash_type}")
 			return None
@@ -232,8 +799,9 @@ class BusyBoxManager:
 		self.console = console_instance
 		self.busybox_path = busybox_path
 		self.busybox_cmd = f"{busybox_path}/busybox"
-		self._available = True
+		self._available = None
 		self._applets = None
+		self._applets_set = frozenset()
 		self.tar_err = None
 		self.proot_cmd = proot_cmd
 
@@ -242,41 +810,33 @@ class BusyBoxManager:
 			status = "✓" if success else "✗"
 			self.console.debug(f"BusyBox: {message} {status}")
 
-	def _run_command(self, command: str, use_busybox: bool = True, timeout: int = 30) -> Any:
+	def _command(self, command: str, use_busybox: bool = True) -> str:
+		if use_busybox and self.is_available():
+			return f"{self.proot_cmd or str()}{self.busybox_cmd} {command}"
+		return command
+
+	def _run_command(self, command: str, use_busybox: bool = True, timeout: int = 30,
+					 stdin_data: str = None) -> Any:
 		try:
-			if use_busybox and self.is_available():
-				cmd = f"{self.proot_cmd or str()}{self.busybox_cmd} {command}"
-			else:
-				cmd = command
-			
-			return self.adb._run_command(cmd)
+			return self.adb._run_command(self._command(command, use_busybox), stdin_data=stdin_data)
 			
 		except Exception as e:
-			class MockResult:
-				def __init__(self, error_msg):
-					self.stdout = ""
-					self.stderr = error_msg
-					self.returncode = 1
-			return MockResult(str(e))
+			return _CmdResult(stderr=str(e))
 
 	def is_available(self) -> bool:
 		if self._available is not None:
 			return self._available
 
-		if not self.adb.exists(self.busybox_cmd):
-			self._available = False
-			self._log("BusyBox not found at specified path", False)
-			return False
-
-		result = self._run_command(f"{self.busybox_cmd} --help", use_busybox=False)
-		success = result.returncode == 0 and "BusyBox" in (result.stdout or "")
+		# One exit status: present, executable and able to run an applet, no help text on the wire
+		busybox = _q(self.busybox_cmd)
+		result = self._run_command(f"test -x {busybox} && {busybox} true", use_busybox=False)
+		success = result.returncode == 0
 
 		self._available = success
 		if success:
-			version_line = (result.stdout or "").splitlines()[0] if result.stdout else 'Unknown version'
-			self._log(f"Available - {version_line}")
+			self._log(f"Available - {self.busybox_cmd}")
 		else:
-			self._log("Not executable or broken", False)
+			self._log("Not found, not executable or broken", False)
 
 		return success
 
@@ -288,29 +848,60 @@ class BusyBoxManager:
 			return []
 
 		result = self._run_command(f"{self.busybox_cmd} --list", use_busybox=False)
-		output = result.stdout or ""
-		self._applets = [applet.strip() for applet in output.splitlines() if applet.strip()]
+		# Applet names never contain whitespace, one split yields the list
+		self._applets = (result.stdout or "").split()
+		self._applets_set = frozenset(self._applets)
 		return self._applets
 
 	def has_applet(self, applet: str) -> bool:
-		return applet in self.get_applets()
+		if applet in _BASE_APPLETS:
+			return self.is_available()
+		if self._applets is None:
+			self.get_applets()
+		return applet in self._applets_set
+
+	def _invalidate(self):
+		# Recursive rm/cp/tar touch whole subtrees, drop every cached query
+		self.__dict__.pop("_ttl_cache", None)
+
+	def _cache_epoch(self) -> int:
+		# Writes made through the ADBFileManager directly also outdate the cached queries
+		return self.adb.writes
+
+	def run(self, command: str, use_busybox: bool = True, timeout: int = 30, stdin_data: str = None) -> Any:
+		"""Run an arbitrary command, it may write anywhere so every cached query is dropped"""
+		result = self._run_command(command, use_busybox, timeout, stdin_data)
+		self._invalidate()
+		return result
+
+	def reset(self):
+		"""Forget the probed binary, its applets and every cached query, e.g. after reinstalling"""
+		self._available = None
+		self._applets = None
+		self._applets_set = frozenset()
+		self._invalidate()
 
 	def mkdir(self, path: str, parents: bool = False, mode: str = None) -> bool:
 		cmd = f"mkdir {'-p ' if parents else ''}"
 		if mode and self.has_applet('mkdir'):
 			cmd += f"-m {mode} "
-		cmd += f"{repr(path)}"
+		cmd += f"{_q(path)}"
 
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"mkdir: {path} (parents={parents}, mode={mode})", success)
 		return success
 
 	def mkdirs(self, *paths: str) -> bool:
+		# mkdir -p takes every path at once
 		success = True
-		for path in paths:
-			if not self.mkdir(path, parents=True):
+		for chunk in _chunk_args([_q(path) for path in paths]):
+			result = self._run_command(f"mkdir -p -- {' '.join(chunk)}")
+			if result.returncode != 0:
 				success = False
+				self.console.verbose(f"mkdirs: {result.stderr or result.stdout}")
+		self._invalidate()
 		self._log(f"mkdirs: {len(paths)} directories", success)
 		return success
 
@@ -318,32 +909,35 @@ class BusyBoxManager:
 		if recursive:
 			return self.remove(path, recursive=True)
 		else:
-			result = self._run_command(f"rmdir {repr(path)}")
+			result = self._run_command(f"rmdir {_q(path)}")
+			self._invalidate()
 			success = result.returncode == 0
 			self._log(f"rmdir: {path} (recursive={recursive})", success)
 			return success
 
 	def remove(self, path: str, recursive: bool = False, force: bool = True) -> bool:
-		cmd = f"rm {'-r ' if recursive else ''}{'-f ' if force else ''}{repr(path)}"
+		cmd = f"rm {'-r ' if recursive else ''}{'-f ' if force else ''}{_q(path)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"remove: {path} (recursive={recursive}, force={force})", success)
 		return success
 
 	def copy(self, src: str, dst: str, recursive: bool = False, preserve: bool = True) -> bool:
-		cmd = f"cp {'-r ' if recursive else ''}{'-p ' if preserve else ''}{repr(src)} {repr(dst)}"
+		cmd = f"cp {'-r ' if recursive else ''}{'-p ' if preserve else ''}{_q(src)} {_q(dst)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"copy: {src} -> {dst} (recursive={recursive})", success)
 		return success
 
 	def move(self, src: str, dst: str, force: bool = True) -> bool:
-		if '*' in src or '?' in src:
-			cmd = f"sh -c 'mv {'-f ' if force else ''}{src} {dst}'"
-		else:
-			cmd = f"mv {'-f ' if force else ''}{repr(src)} {repr(dst)}"
+		# The session shell expands a wildcard source before mv sees it
+		source = _q_glob(src) if '*' in src or '?' in src else _q(src)
+		cmd = f"mv {'-f ' if force else ''}{source} {_q(dst)}"
 
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"move: {src} -> {dst}", success)
 		return success
@@ -355,8 +949,9 @@ class BusyBoxManager:
 		return self.move(path, new_path)
 
 	def chmod(self, path: str, mode: str, recursive: bool = False) -> bool:
-		cmd = f"chmod {'-R ' if recursive else ''}{mode} {repr(path)}"
+		cmd = f"chmod {'-R ' if recursive else ''}{mode} {_q(path)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"chmod: {path} {mode} (recursive={recursive})", success)
 		return success
@@ -367,8 +962,9 @@ class BusyBoxManager:
 			return False
 
 		ownership = f"{owner}:{group}" if group else owner
-		cmd = f"chown {'-R ' if recursive else ''}{ownership} {repr(path)}"
+		cmd = f"chown {'-R ' if recursive else ''}{ownership} {_q(path)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"chown: {path} {ownership} (recursive={recursive})", success)
 		return success
@@ -382,88 +978,88 @@ class BusyBoxManager:
 	def make_executable(self, path: str) -> bool:
 		return self.chmod(path, "755")
 
+	def _stat(self, path: str) -> Optional[Dict[str, Any]]:
+		# -L follows links like test -e/-f/-d, every answer below comes from this one call
+		result = self._run_command(f"stat -L -c '{_STAT_FORMAT}' -- {_q(path)} 2>/dev/null")
+		info = _parse_stat_line(result.stdout or "") if result.returncode == 0 else None
+		self._log(f"stat: {path}", info is not None)
+		return info
+
+	@_ttl_cached(2.0, maxsize=256)
+	def stat(self, path: str) -> Optional[Dict[str, Any]]:
+		"""Cached stat of path, see _ttl_cached for the writes it cannot see"""
+		return self._stat(path)
+
 	def exists(self, path: str) -> bool:
-		result = self._run_command(f"test -e {repr(path)} && echo exists || echo missing")
-		success = result.returncode == 0 and "exists" in (result.stdout or "")
+		# Existence is asked fresh, other processes create and remove files under our feet
+		success = self._stat(path) is not None
 		self._log(f"exists: {path}", success)
 		return success
 
 	def is_file(self, path: str) -> bool:
-		result = self._run_command(f"test -f {repr(path)} && echo file || echo not_file")
-		success = result.returncode == 0 and "file" in (result.stdout or "")
+		info = self.stat(path)
+		success = info is not None and info['is_file']
 		self._log(f"is_file: {path}", success)
 		return success
 
 	def is_dir(self, path: str) -> bool:
-		result = self._run_command(f"test -d {repr(path)} && echo dir || echo not_dir")
-		success = result.returncode == 0 and "dir" in (result.stdout or "")
+		info = self.stat(path)
+		success = info is not None and info['is_dir']
 		self._log(f"is_dir: {path}", success)
 		return success
 
 	def get_size(self, path: str) -> Optional[int]:
-		result = self._run_command(f"stat -c %s {repr(path)} 2>/dev/null || echo")
-		output = result.stdout or ""
-		if result.returncode == 0 and output.strip().isdigit():
-			size = int(output.strip())
-			self._log(f"get_size: {path} -> {size} bytes", True)
-			return size
+		info = self.stat(path)
+		if info is not None:
+			self._log(f"get_size: {path} -> {info['size']} bytes", True)
+			return info['size']
 		self._log(f"get_size failed: {path}", False)
 		return None
 
 	def get_mtime(self, path: str) -> Optional[float]:
-		result = self._run_command(f"stat -c %Y {repr(path)} 2>/dev/null || echo")
-		output = result.stdout or ""
-		if result.returncode == 0 and output.strip().isdigit():
-			mtime = float(output.strip())
-			self._log(f"get_mtime: {path} -> {mtime}", True)
-			return mtime
+		info = self.stat(path)
+		if info is not None:
+			self._log(f"get_mtime: {path} -> {info['mtime']}", True)
+			return info['mtime']
 		self._log(f"get_mtime failed: {path}", False)
 		return None
 
+	def batch_stat(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+		stats = {}
+		for chunk in _chunk_args([_q(path) for path in paths]):
+			# -L like stat() and test -f/-d, a link reports the type of what it points at
+			result = self._run_command(f"stat -L -c '{_STAT_FORMAT}' -- {' '.join(chunk)} 2>/dev/null")
+			# stat exits non-zero when any path is missing but still reports the others
+			for line in (result.stdout or result.stderr or "").splitlines():
+				info = _parse_stat_line(line)
+				if info:
+					stats[info['name']] = info
+
+		self._log(f"batch_stat: {len(stats)}/{len(paths)} paths", True)
+		return [stats.get(path) for path in paths]
+
+	def batch_exists(self, paths: List[str]) -> Dict[str, bool]:
+		found = set()
+		for chunk in _chunk_args([_q(path) for path in paths]):
+			result = self._run_command(f"stat -c '%n' -- {' '.join(chunk)} 2>/dev/null")
+			found.update((result.stdout or result.stderr or "").splitlines())
+
+		self._log(f"batch_exists: {len(found)}/{len(paths)} paths", True)
+		return {path: path in found for path in paths}
+
+	@_ttl_cached(2.0, maxsize=256)
 	def get_info(self, path: str) -> Optional[Dict[str, Any]]:
-		if not self.exists(path):
-			return None
-
 		try:
-			result = self._run_command(f"stat -c '%n|%s|%F|%U|%G|%a|%Y|%X|%Z' {repr(path)}")
-			output = result.stdout or ""
-			if result.returncode == 0 and '|' in output:
-				parts = output.strip().split('|')
-				if len(parts) == 9:
-					info = {
-						'name': parts[0],
-						'size': int(parts[1]),
-						'type': parts[2],
-						'owner': parts[3],
-						'group': parts[4],
-						'permissions': parts[5],
-						'mtime': float(parts[6]),
-						'atime': float(parts[7]),
-						'ctime': float(parts[8]),
-						'is_file': self.is_file(path),
-						'is_dir': self.is_dir(path)
-					}
-					self._log(f"get_info: {path}", True)
-					return info
-
-			info = {
-				'path': path,
-				'exists': True,
-				'is_file': self.is_file(path),
-				'is_dir': self.is_dir(path),
-				'size': self.get_size(path),
-				'mtime': self.get_mtime(path)
-			}
-			self._log(f"get_info: {path} (basic)", True)
+			info = self.batch_stat([path])[0]
+			self._log(f"get_info: {path}", info is not None)
 			return info
-
 		except Exception as e:
 			self._log(f"get_info failed: {path} - {e}", False)
 			return None
 
 	def list_dir(self, path: str, pattern: str = "*") -> List[str]:
 		try:
-			cmd = f"ls -1 {repr(path)}/{pattern} 2>/dev/null || echo"
+			cmd = f"ls -1 {_q(path)}/{_q_glob(pattern)} 2>/dev/null || echo"
 			result = self._run_command(cmd)
 			output = result.stdout or ""
 			items = [item for item in output.splitlines() if item.strip()]
@@ -473,30 +1069,65 @@ class BusyBoxManager:
 			self._log(f"list_dir failed: {path} - {e}", False)
 			return []
 
-	def find_files(self, root: str, pattern: str = "*", recursive: bool = True) -> List[str]:
+	def list_dir_rich(self, path: str, pattern: str = "*", recursive: bool = False,
+					  maxdepth: int = 1, file_type: str = None) -> List[Dict[str, Any]]:
+		# BusyBox/toybox find has no -printf, so stat the matches in the same invocation
+		depth = "" if recursive else f" -maxdepth {maxdepth}"
+		type_filter = f" -type {file_type}" if file_type else ""
+		cmd = (f"find {_q(path)} -mindepth 1{depth} -name {_q(pattern)}{type_filter} "
+			   f"-exec stat -c '%n|%F|%s|%Y' {{}} + 2>/dev/null")
 		try:
-			if recursive:
-				cmd = f"find {repr(root)} -name {repr(pattern)} -type f 2>/dev/null || echo"
-			else:
-				cmd = f"find {repr(root)} -maxdepth 1 -name {repr(pattern)} -type f 2>/dev/null || echo"
-
 			result = self._run_command(cmd)
-			output = result.stdout or ""
-			files = [file for file in output.splitlines() if file.strip()]
-			self._log(f"find_files: {root} -> {len(files)} files", True)
-			return files
+			entries = []
+			for line in (result.stdout or result.stderr or "").splitlines():
+				parts = line.rsplit('|', 3)
+				if len(parts) != 4:
+					continue
+				try:
+					entries.append({
+						'path': parts[0],
+						'type': _STAT_TYPE_CODES.get(parts[1].lower(), '?'),
+						'size': int(parts[2]),
+						'mtime': float(parts[3])
+					})
+				except ValueError:
+					continue
+			self._log(f"list_dir_rich: {path} -> {len(entries)} entries", True)
+			return entries
 		except Exception as e:
-			self._log(f"find_files failed: {root} - {e}", False)
+			self._log(f"list_dir_rich failed: {path} - {e}", False)
 			return []
 
+	@_ttl_cached(2.0, maxsize=64)
+	def _file_listing(self, root: str, recursive: bool, max_depth: int = None) -> List[str]:
+		base = _q(root.rstrip('/'))
+		if not recursive:
+			# Glob and test are shell builtins, a shallow listing forks nothing
+			cmd = f'for f in {base}/* {base}/.*; do [ -f "$f" ] && [ ! -L "$f" ] && echo "$f"; done; true'
+			result = self._run_command(cmd, use_busybox=False)
+		else:
+			depth = f" -maxdepth {int(max_depth)}" if max_depth is not None else ""
+			result = self._run_command(f"find {_q(root)} -mindepth 1{depth} -type f 2>/dev/null; true")
+		return [line for line in (result.stdout or "").splitlines() if line]
+
+	def find_files(self, root: str, pattern: str = "*", recursive: bool = True,
+				   max_depth: int = None) -> List[str]:
+		# One remote scan per root serves every pattern, matched on the basename like find -name
+		match = _name_matcher(pattern)
+		files = [path for path in self._file_listing(root, recursive, max_depth)
+				 if match(path.rsplit('/', 1)[-1])]
+		self._log(f"find_files: {root} -> {len(files)} files", True)
+		return files
+
 	def glob(self, pattern: str) -> List[str]:
 		return self.list_dir(".", pattern)
 
 	def tar_extract(self, archive: str, target_dir: str, preserve_permissions: bool = True) -> bool:
-		cmd = f"tar -xf {repr(archive)} -C {repr(target_dir)}"
+		cmd = f"tar -xf {_q(archive)} -C {_q(target_dir)}"
 		if preserve_permissions:
 			cmd += " -p"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self.tar_err = result.stderr
 		self.console.debug(f"tar_extract result: {result.stdout}, error message: {result.stderr}")
@@ -504,33 +1135,27 @@ class BusyBoxManager:
 		return success
 
 	def tar_create(self, source: str, archive: str, compression: str = "") -> bool:
-		compression_flag = {
-			"gz": "z", "gzip": "z",
-			"bz2": "j", "bzip2": "j",
-			"xz": "J",
-			"": ""
-		}.get(compression.lower(), "")
-
-		cmd = f"tar -c{compression_flag}f {repr(archive)} {repr(source)}"
+		compression_flag = _TAR_COMPRESSION.get(compression.lower(), "")
+
+		cmd = f"tar -c{compression_flag}f {_q(archive)} {_q(source)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"tar_create: {source} -> {archive} (compression={compression})", success)
 		return success
 
 	def checksum(self, path: str, hash_type: str = "sha256") -> Optional[str]:
-		supported_hashes = {
-			"md5": "md5sum",
-			"sha1": "sha1sum",
-			"sha256": "sha256sum",
-			"sha512": "sha512sum"
-		}
-
-		hash_cmd = supported_hashes.get(hash_type.lower())
+		hash_cmd = _HASH_CMDS.get(hash_type.lower())
 		if not hash_cmd or not self.has_applet(hash_cmd):
 			self._log(f"Hash type {hash_type} not supported", False)
 			return None
 
-		result = self._run_command(f"{hash_cmd} {repr(path)}")
+		checksum = _local_checksum(path, hash_type.lower())
+		if checksum:
+			self._log(f"checksum: {path} -> {checksum} ({hash_type}, local)", True)
+			return checksum
+
+		result = self._run_command(f"{hash_cmd} {_q(path)}")
 		if result.returncode == 0:
 			output = result.stdout or ""
 			parts = output.split()
@@ -542,11 +1167,90 @@ class BusyBoxManager:
 		return None
 
 	def verify_checksum(self, path: str, expected_hash: str, hash_type: str = "sha256") -> bool:
-		actual_hash = self.checksum(path, hash_type)
-		return actual_hash == expected_hash if actual_hash else False
+		# Host-readable files compare raw digests, no hexdigest round trip
+		actual = _local_digest(path, hash_type.lower())
+		if actual is None:
+			actual = self.checksum(path, hash_type)
+		return _digest_equal(actual, expected_hash)
+
+	def verify_checksums(self, pairs: Dict[str, str], hash_type: str = "sha256") -> Dict[str, bool]:
+		hash_cmd = _HASH_CMDS.get(hash_type.lower())
+		results = {}
+		remote = {}
+		for path, expected in pairs.items():
+			local = _local_digest(path, hash_type.lower())
+			if local is not None:
+				results[path] = _digest_equal(local, expected)
+			elif "\n" in path or "\\" in path or not hash_cmd:
+				# Not representable in a checksum manifest line
+				results[path] = self.verify_checksum(path, expected, hash_type)
+			else:
+				remote[path] = expected
+
+		if len(remote) == 1:
+			path, expected = remote.popitem()
+			results[path] = self.verify_checksum(path, expected, hash_type)
+		elif remote and self.has_applet(hash_cmd):
+			# One pass over every file, the manifest goes in on stdin
+			manifest = "".join(f"{expected}  {path}\n" for path, expected in remote.items())
+			result = self._run_command(f"{hash_cmd} -c -", stdin_data=manifest)
+			passed = {line[:-4] for line in (result.stdout or result.stderr or "").splitlines()
+					  if line.endswith(": OK")}
+			results.update({path: path in passed for path in remote})
+		else:
+			results.update({path: False for path in remote})
+
+		self._log(f"verify_checksums: {sum(results.values())}/{len(pairs)} ok ({hash_type})", all(results.values()))
+		return {path: results[path] for path in pairs}
+
+	def batch_checksum(self, paths: List[str], hash_type: str = "sha256") -> Dict[str, Optional[str]]:
+		hash_cmd = _HASH_CMDS.get(hash_type.lower())
+		if not hash_cmd or not self.has_applet(hash_cmd):
+			self._log(f"Hash type {hash_type} not supported", False)
+			return {path: None for path in paths}
+
+		# hashlib drops the GIL, local files hash in parallel
+		with ThreadPoolExecutor(max_workers=min(_ZIP_WORKERS, len(paths) or 1)) as executor:
+			sums = dict(zip(paths, executor.map(lambda path: _local_checksum(path, hash_type.lower()), paths)))
+
+		# The session serializes commands, so the rest go as one invocation per chunk
+		remote = [path for path, checksum in sums.items()
+				  if not checksum and "\n" not in path and "\\" not in path]
+		for chunk in _chunk_args([_q(path) for path in remote]):
+			result = self._run_command(f"{hash_cmd} -- {' '.join(chunk)} 2>/dev/null")
+			for line in (result.stdout or result.stderr or "").splitlines():
+				checksum, sep, path = line.partition("  ")
+				if sep and path in sums:
+					sums[path] = checksum
+
+		self._log(f"batch_checksum: {sum(1 for v in sums.values() if v)}/{len(paths)} files ({hash_type})", True)
+		return {path: sums[path] for path in paths}
+
+	def checksum_tree(self, root: str, hash_type: str = "sha256", pattern: str = "*") -> Dict[str, str]:
+		hash_cmd = _HASH_CMDS.get(hash_type.lower())
+		if not hash_cmd or not self.has_applet(hash_cmd):
+			self._log(f"Hash type {hash_type} not supported", False)
+			return {}
+
+		# Every file under root is hashed by the same remote find, one round-trip in total
+		result = self._run_command(f"find {_q(root)} -type f -name {_q(pattern)} -exec {hash_cmd} {{}} + 2>/dev/null")
+		sums = {}
+		for line in (result.stdout or result.stderr or "").splitlines():
+			checksum, sep, path = line.partition("  ")
+			# A leading backslash marks an escaped name that can't be mapped back
+			if sep and not checksum.startswith("\\"):
+				sums[path] = checksum
+		self._log(f"checksum_tree: {root} -> {len(sums)} files ({hash_type})", bool(sums))
+		return sums
+
+	def verify_tree(self, root: str, expected: Dict[str, str], hash_type: str = "sha256") -> Dict[str, bool]:
+		sums = self.checksum_tree(root, hash_type)
+		results = {path: sums.get(path) == checksum for path, checksum in expected.items()}
+		self._log(f"verify_tree: {sum(results.values())}/{len(expected)} ok ({hash_type})", all(results.values()))
+		return results
 
 	def read_text(self, path: str, encoding: str = "utf-8") -> Optional[str]:
-		result = self._run_command(f"cat {repr(path)}")
+		result = self._run_command(f"cat {_q(path)}")
 		if result.returncode == 0:
 			output = result.stdout or ""
 			self._log(f"read_text: {path} -> {len(output)} chars", True)
@@ -555,23 +1259,32 @@ class BusyBoxManager:
 		return None
 
 	def write_text(self, path: str, content: str) -> bool:
-		escaped_content = content.replace("'", "'\"'\"'")
-		cmd = f"echo '{escaped_content}' > {repr(path)}"
-		result = self._run_command(cmd)
+		result = self._run_command(f"cat > {_q(path)}", stdin_data=content)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"write_text: {path} -> {len(content)} chars", success)
 		return success
 
 	def read_bytes(self, path: str) -> Optional[bytes]:
+		try:
+			# Raw stdout of a one-shot process, no base64 inflation or decode
+			result = self.adb.rish.run_binary(self._command(f"cat -- {_q(path)}"))
+			if result.returncode == 0:
+				self._log(f"read_bytes: {path} -> {len(result.stdout)} bytes", True)
+				return result.stdout
+			self._log(f"read_bytes: {path}", False)
+			return None
+		except (OSError, subprocess.SubprocessError) as e:
+			self._log(f"read_bytes: binary read failed, using base64 - {e}", False)
+
 		if not self.has_applet('base64'):
 			self._log("base64 applet not available for binary read", False)
 			return None
 
-		result = self._run_command(f"base64 {repr(path)}")
+		result = self._run_command(f"base64 {_q(path)}")
 		if result.returncode == 0:
 			output = result.stdout or ""
 			try:
-				import base64
 				content = base64.b64decode(output)
 				self._log(f"read_bytes: {path} -> {len(content)} bytes", True)
 				return content
@@ -579,34 +1292,54 @@ class BusyBoxManager:
 				self._log(f"read_bytes decode failed: {path} - {e}", False)
 		return None
 
+	def write_bytes(self, path: str, data: bytes, append: bool = False) -> bool:
+		if not self.has_applet('base64'):
+			self._log("base64 applet not available for binary write", False)
+			return False
+
+		# The session is text based, base64 carries any byte and never needs quoting
+		redirect = ">>" if append else ">"
+		result = self._run_command(f"base64 -d {redirect} {_q(path)}",
+								   stdin_data=base64.encodebytes(data).decode("ascii"))
+		self._invalidate()
+		success = result.returncode == 0
+		self._log(f"write_bytes: {path} -> {len(data)} bytes (append={append})", success)
+		return success
+
 	def append_text(self, path: str, content: str) -> bool:
-		escaped_content = content.replace("'", "'\"'\"'")
-		cmd = f"echo '{escaped_content}' >> {repr(path)}"
-		result = self._run_command(cmd)
+		result = self._run_command(f"cat >> {_q(path)}", stdin_data=content)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"append_text: {path} -> +{len(content)} chars", success)
 		return success
 
 	def bulk_copy(self, sources: List[str], target_dir: str) -> bool:
 		success = True
-		for src in sources:
-			dst = f"{target_dir.rstrip('/')}/{src.split('/')[-1]}"
-			if not self.copy(src, dst):
+		target = _q(f"{target_dir.rstrip('/')}/")
+		for chunk in _chunk_args([_q(src) for src in sources], _ARG_CHUNK - len(target)):
+			result = self._run_command(f"cp -p -- {' '.join(chunk)} {target}")
+			if result.returncode != 0:
 				success = False
+				self.console.verbose(f"bulk_copy: {result.stderr or result.stdout}")
+		self._invalidate()
 		self._log(f"bulk_copy: {len(sources)} files -> {target_dir}", success)
 		return success
 
 	def bulk_remove(self, paths: List[str]) -> bool:
 		success = True
-		for path in paths:
-			if not self.remove(path, recursive=True, force=True):
+		for chunk in _chunk_args([_q(path) for path in paths]):
+			result = self._run_command(f"rm -r -f -- {' '.join(chunk)}")
+			if result.returncode != 0:
 				success = False
+				self.console.verbose(f"bulk_remove: {result.stderr or result.stdout}")
+		self._invalidate()
 		self._log(f"bulk_remove: {len(paths)} items", success)
 		return success
 
 	def clean_dir(self, path: str) -> bool:
-		cmd = f"rm -rf {repr(path)}/* {repr(path)}/.* 2>/dev/null && echo cleaned"
+		cmd = f"rm -rf {_q(path)}/* {_q(path)}/.* 2>/dev/null && echo cleaned"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0 or "cleaned" in (result.stdout or "")
 		self._log(f"clean_dir: {path}", success)
 		return success
@@ -616,8 +1349,9 @@ class BusyBoxManager:
 			self._log("ln applet not available", False)
 			return False
 
-		cmd = f"ln -sf {repr(target)} {repr(link_path)}"
+		cmd = f"ln -sf {_q(target)} {_q(link_path)}"
 		result = self._run_command(cmd)
+		self._invalidate()
 		success = result.returncode == 0
 		self._log(f"create_symlink: {target} -> {link_path}", success)
 		return success
@@ -627,18 +1361,19 @@ class BusyBoxManager:
 			self._log("readlink applet not available", False)
 			return None
 
-		result = self._run_command(f"readlink {repr(link_path)}")
+		result = self._run_command(f"readlink {_q(link_path)}")
 		if result.returncode == 0:
 			output = result.stdout or ""
 			self._log(f"read_symlink: {link_path} -> {output}", True)
 			return output.strip()
 		return None
 
+	@_ttl_cached(2.0)
 	def get_disk_usage(self, path: str = "/") -> Optional[Dict[str, Any]]:
 		if not self.has_applet('df'):
 			return None
 
-		result = self._run_command(f"df -k {repr(path)}")
+		result = self._run_command(f"df -k {_q(path)}")
 		if result.returncode == 0:
 			output = result.stdout or ""
 			if len(output.splitlines()) > 1:
@@ -655,6 +1390,7 @@ class BusyBoxManager:
 					}
 		return None
 
+	@_ttl_cached(2.0)
 	def get_memory_info(self) -> Optional[Dict[str, Any]]:
 		if not self.has_applet('free'):
 			return None
@@ -678,26 +1414,58 @@ class BusyBoxManager:
 
 class PyFManager:
 
-	def __init__(self, console=None):
+	def __init__(self, console=None, bulk_workers: int = 16):
 		self.console = console
+		self._bulk_workers = bulk_workers
 
-	def _log(self, message: str, success: bool = True):
-		"""Internal logging method"""
-		if self.console:
+	def _log(self, message: str, *args, success: bool = True):
+		"""Internal logging method, message is %-formatted with args only once it is known to print"""
+		if self.console and getattr(self.console, "log_level", LogLevel.DEBUG).value >= LogLevel.DEBUG.value:
+			if args:
+				message = message % args
 			status = "✓" if success else "✗"
-			self.console.debug(f"PyFManager: {message} {status}")
+			line = f"PyFManager: {message} {status}"
+			log_queue = getattr(_bulk_log, "queue", None)
+			if log_queue is not None:
+				log_queue.put(line)
+			else:
+				self.console.debug(line)
+
+	def _bulk(self, func, *iterables) -> List[Any]:
+		"""Map func over the items on a thread pool, serially when there is nothing to overlap"""
+		items = list(zip(*iterables))
+		workers = min(self._bulk_workers, len(items))
+		if workers <= 1 or len(items) < _BULK_MIN_ITEMS:
+			return [func(*item) for item in items]
+
+		# Workers only queue their log lines, the caller prints them once the pool is done
+		log_queue = queue.SimpleQueue()
+
+		def work(*item):
+			_bulk_log.queue = log_queue
+			try:
+				return func(*item)
+			finally:
+				_bulk_log.queue = None
+
+		try:
+			with ThreadPoolExecutor(max_workers=workers) as executor:
+				return list(executor.map(work, *zip(*items)))
+		finally:
+			while not log_queue.empty():
+				self.console.debug(log_queue.get_nowait())
 
 	# ========== DIRECTORY OPERATIONS ==========
 
 	def mkdir(self, path: Union[str, Path], parents: bool = False, exist_ok: bool = True) -> bool:
 		"""Create directory with optional parent creation"""
 		try:
-			path = Path(path)
+			path = _as_path(path)
 			path.mkdir(parents=parents, exist_ok=exist_ok)
-			self._log(f"mkdir: {path} (parents={parents})")
+			self._log("mkdir: %s (parents=%s)", path, parents)
 			return True
 		except Exception as e:
-			self._log(f"mkdir failed: {path} - {e}", False)
+			self._log("mkdir failed: %s - %s", path, e, success=False)
 			return False
 
 	def mkdirs(self, *paths: Union[str, Path]) -> bool:
@@ -711,15 +1479,15 @@ class PyFManager:
 	def rmdir(self, path: Union[str, Path], recursive: bool = False) -> bool:
 		"""Remove directory"""
 		try:
-			path = Path(path)
+			path = _as_path(path)
 			if recursive:
 				shutil.rmtree(path)
 			else:
 				path.rmdir()
-			self._log(f"rmdir: {path} (recursive={recursive})")
+			self._log("rmdir: %s (recursive=%s)", path, recursive)
 			return True
 		except Exception as e:
-			self._log(f"rmdir failed: {path} - {e}", False)
+			self._log("rmdir failed: %s - %s", path, e, success=False)
 			return False
 
 	# ========== FILE OPERATIONS ==========
@@ -727,50 +1495,58 @@ class PyFManager:
 	def remove(self, path: Union[str, Path], missing_ok: bool = True) -> bool:
 		"""Remove file or directory"""
 		try:
-			path = Path(path)
-			if path.is_dir():
-				shutil.rmtree(path)
-			else:
+			path = _as_path(path)
+			# unlink reports a directory itself, no stat up front
+			try:
 				path.unlink(missing_ok=missing_ok)
-			self._log(f"remove: {path}")
+			except IsADirectoryError:
+				shutil.rmtree(path)
+			except PermissionError:
+				# EPERM is how non-Linux kernels refuse to unlink a directory
+				if not path.is_dir() or path.is_symlink():
+					raise
+				shutil.rmtree(path)
+			self._log("remove: %s", path)
 			return True
 		except Exception as e:
-			self._log(f"remove failed: {path} - {e}", False)
+			self._log("remove failed: %s - %s", path, e, success=False)
 			return False
 
 	def copy(self, src: Union[str, Path], dst: Union[str, Path],
 			 overwrite: bool = True, preserve_metadata: bool = True) -> bool:
 		"""Copy file or directory"""
 		try:
-			src, dst = Path(src), Path(dst)
+			src, dst = _as_path(src), _as_path(dst)
 
+			# Only a no-overwrite copy needs to look at dst, _fast_copy stats it anyway
+			if not overwrite and dst.exists():
+				return False
 			if src.is_dir():
-				if dst.exists() and not overwrite:
-					return False
-				if preserve_metadata:
-					shutil.copytree(src, dst, dirs_exist_ok=overwrite)
-				else:
-					shutil.copytree(src, dst, dirs_exist_ok=overwrite,
-								  copy_function=shutil.copy)
+				shutil.copytree(src, dst, dirs_exist_ok=overwrite,
+								copy_function=lambda s, d: _fast_copy(s, d, preserve_metadata))
 			else:
-				if dst.exists() and not overwrite:
-					return False
-				if preserve_metadata:
-					shutil.copy2(src, dst)
-				else:
-					shutil.copy(src, dst)
+				_fast_copy(src, dst, preserve_metadata)
 
-			self._log(f"copy: {src} -> {dst}")
+			self._log("copy: %s -> %s", src, dst)
 			return True
 		except Exception as e:
-			self._log(f"copy failed: {src} -> {dst} - {e}", False)
+			self._log("copy failed: %s -> %s - %s", src, dst, e, success=False)
 			return False
 
 	def move(self, src: Union[str, Path], dst: Union[str, Path],
 			 overwrite: bool = True) -> bool:
 		"""Move file or directory"""
 		try:
-			src, dst = Path(src), Path(dst)
+			src, dst = _as_path(src), _as_path(dst)
+
+			if overwrite:
+				try:
+					# Atomic replace covers file -> file and dir -> empty dir without touching dst first
+					os.replace(src, dst)
+					self._log("move: %s -> %s", src, dst)
+					return True
+				except OSError:
+					pass
 
 			if dst.exists():
 				if overwrite:
@@ -778,23 +1554,24 @@ class PyFManager:
 				else:
 					return False
 
-			shutil.move(str(src), str(dst))
-			self._log(f"move: {src} -> {dst}")
+			# rename(2) first; across filesystems the data goes through copy_file_range
+			shutil.move(str(src), str(dst), copy_function=_fast_copy)
+			self._log("move: %s -> %s", src, dst)
 			return True
 		except Exception as e:
-			self._log(f"move failed: {src} -> {dst} - {e}", False)
+			self._log("move failed: %s -> %s - %s", src, dst, e, success=False)
 			return False
 
 	def rename(self, path: Union[str, Path], new_name: str) -> bool:
 		"""Rename file or directory"""
 		try:
-			path = Path(path)
+			path = _as_path(path)
 			new_path = path.with_name(new_name)
 			path.rename(new_path)
-			self._log(f"rename: {path} -> {new_name}")
+			self._log("rename: %s -> %s", path, new_name)
 			return True
 		except Exception as e:
-			self._log(f"rename failed: {path} - {e}", False)
+			self._log("rename failed: %s - %s", path, e, success=False)
 			return False
 
 	# ========== PERMISSIONS OPERATIONS ==========
@@ -802,65 +1579,101 @@ class PyFManager:
 	def chmod(self, path: Union[str, Path], mode: Union[int, str]) -> bool:
 		"""Change file permissions"""
 		try:
-			path = Path(path)
+			path = _as_path(path)
 			if isinstance(mode, str):
-				mode = int(mode, 8)  # Convert octal string to int
+				mode = _OCTAL_MODES.get(mode) or int(mode, 8)  # Convert octal string to int
 			path.chmod(mode)
-			self._log(f"chmod: {path} {oct(mode)}")
+			self._log("chmod: %s %#o", path, mode)
 			return True
 		except Exception as e:
-			self._log(f"chmod failed: {path} - {e}", False)
+			self._log("chmod failed: %s - %s", path, e, success=False)
 			return False
 
 	def chown(self, path: Union[str, Path], uid: int = -1, gid: int = -1) -> bool:
 		"""Change file owner (Unix only)"""
 		try:
 			import os
-			path = Path(path)
+			path = _as_path(path)
 			os.chown(path, uid, gid)
-			self._log(f"chown: {path} uid={uid} gid={gid}")
+			self._log("chown: %s uid=%s gid=%s", path, uid, gid)
+			return True
+		except Exception as e:
+			self._log("chown failed: %s - %s", path, e, success=False)
+			return False
+
+	def _set_mode(self, path: Union[str, Path], mode: int) -> bool:
+		"""chmod with a known integer mode, no parsing or Path construction"""
+		try:
+			os.chmod(path, mode)
+			self._log("chmod: %s %s", path, _PERM_STR[mode & 0o777])
 			return True
 		except Exception as e:
-			self._log(f"chown failed: {path} - {e}", False)
+			self._log("chmod failed: %s - %s", path, e, success=False)
 			return False
 
 	def make_readonly(self, path: Union[str, Path]) -> bool:
 		"""Make file read-only"""
-		return self.chmod(path, 0o444)
+		return self._set_mode(path, 0o444)
 
 	def make_writable(self, path: Union[str, Path]) -> bool:
 		"""Make file writable"""
-		return self.chmod(path, 0o644)
+		return self._set_mode(path, 0o644)
 
 	def make_executable(self, path: Union[str, Path]) -> bool:
 		"""Make file executable"""
-		return self.chmod(path, 0o755)
+		return self._set_mode(path, 0o755)
+
+	def bulk_chmod(self, paths: List[Union[str, Path]], mode: Union[int, str]) -> bool:
+		"""Change permissions of many paths, logging one summary line"""
+		try:
+			if isinstance(mode, str):
+				mode = _OCTAL_MODES.get(mode) or int(mode, 8)
+		except ValueError as e:
+			self._log("bulk_chmod failed: invalid mode %s - %s", mode, e, success=False)
+			return False
+
+		failed = 0
+		for path in paths:
+			try:
+				os.chmod(path, mode)
+			except OSError as e:
+				failed += 1
+				self._log("bulk_chmod failed: %s - %s", path, e, success=False)
+		self._log("bulk_chmod: %s/%s paths %#o", len(paths) - failed, len(paths), mode, success=not failed)
+		return not failed
 
 	# ========== FILE INFORMATION ==========
 
+	@staticmethod
+	def _stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+		"""Single stat behind the existence and type checks, None when it fails"""
+		return _try_stat(path)
+
 	def exists(self, path: Union[str, Path]) -> bool:
 		"""Check if path exists"""
-		return Path(path).exists()
+		return self._stat(path) is not None
 
 	def is_file(self, path: Union[str, Path]) -> bool:
 		"""Check if path is a file"""
-		return Path(path).is_file()
+		stat_info = self._stat(path)
+		return stat_info is not None and stat.S_ISREG(stat_info.st_mode)
 
 	def is_dir(self, path: Union[str, Path]) -> bool:
 		"""Check if path is a directory"""
-		return Path(path).is_dir()
+		stat_info = self._stat(path)
+		return stat_info is not None and stat.S_ISDIR(stat_info.st_mode)
 
 	def get_size(self, path: Union[str, Path]) -> int:
 		"""Get file size in bytes"""
-		return Path(path).stat().st_size
+		return os.stat(path).st_size
 
 	def get_mtime(self, path: Union[str, Path]) -> float:
 		"""Get modification time"""
-		return Path(path).stat().st_mtime
+		return os.stat(path).st_mtime
 
 	def get_info(self, path: Union[str, Path]) -> Dict[str, Any]:
 		"""Get comprehensive file information"""
-		path = Path(path)
+		path = _as_path(path)
 		stat_info = path.stat()
 		return {
 			'path': str(path),
@@ -870,100 +1683,234 @@ class PyFManager:
 			'mtime': datetime.fromtimestamp(stat_info.st_mtime),
 			'ctime': datetime.fromtimestamp(stat_info.st_ctime),
 			'atime': datetime.fromtimestamp(stat_info.st_atime),
-			'is_file': path.is_file(),
-			'is_dir': path.is_dir(),
-			'permissions': oct(stat_info.st_mode)[-3:],
+			'is_file': stat.S_ISREG(stat_info.st_mode),
+			'is_dir': stat.S_ISDIR(stat_info.st_mode),
+			'permissions': _PERM_STR[stat_info.st_mode & 0o777],
 		}
 
+	def get_info_bulk(self, root: Union[str, Path]) -> Dict[str, List[Any]]:
+		"""Stat every entry of a directory into parallel lists, raw epoch times"""
+		info = {'paths': [], 'names': [], 'sizes': [], 'mtimes': [], 'is_dir': []}
+		try:
+			with os.scandir(root) as entries:
+				entries = sorted(entries, key=lambda entry: entry.name)
+			for entry in entries:
+				try:
+					stat_info = entry.stat()
+				except FileNotFoundError:
+					# Dangling symlink, report the link itself
+					stat_info = entry.stat(follow_symlinks=False)
+				info['paths'].append(entry.path)
+				info['names'].append(entry.name)
+				info['sizes'].append(stat_info.st_size)
+				info['mtimes'].append(stat_info.st_mtime)
+				info['is_dir'].append(stat.S_ISDIR(stat_info.st_mode))
+			self._log("get_info_bulk: %s (%s entries)", root, len(entries))
+		except Exception as e:
+			self._log("get_info_bulk failed: %s - %s", root, e, success=False)
+		return info
+
 	# ========== SEARCH AND LISTING ==========
 
-	def list_dir(self, path: Union[str, Path], pattern: str = "*") -> List[Path]:
-		"""List directory contents with optional pattern matching"""
+	def list_dir(self, path: Union[str, Path], pattern: str = "*", sort: bool = False) -> List[Path]:
+		"""List directory contents with optional pattern matching, in name order when sort"""
 		try:
-			path = Path(path)
-			return sorted([p for p in path.glob(pattern)])
+			path = _as_path(path)
+			if "/" in pattern:
+				items = list(path.glob(pattern))
+			else:
+				match = _name_matcher(pattern)
+				with os.scandir(path) as entries:
+					items = [Path(entry.path) for entry in entries if match(entry.name)]
+			return sorted(items) if sort else items
 		except Exception as e:
-			self._log(f"list_dir failed: {path} - {e}", False)
+			self._log("list_dir failed: %s - %s", path, e, success=False)
 			return []
 
 	def find_files(self, root: Union[str, Path], pattern: str = "*",
-				   recursive: bool = True) -> List[Path]:
-		"""Find files matching pattern"""
+				   recursive: bool = True, sort: bool = False) -> List[Path]:
+		"""Find files matching pattern, in path order when sort"""
 		try:
-			root = Path(root)
-			if recursive:
-				return sorted([p for p in root.rglob(pattern) if p.is_file()])
-			else:
-				return sorted([p for p in root.glob(pattern) if p.is_file()])
+			root = _as_path(root)
+			if "/" in pattern:
+				matches = root.rglob(pattern) if recursive else root.glob(pattern)
+				files = [p for p in matches if p.is_file()]
+				return sorted(files) if sort else files
+			if sort:
+				return list(self.iter_files(root, pattern, recursive))
+			# Plain scandir order, no per-directory sort
+			match = _name_matcher(pattern)
+			return [Path(entry.path) for entry in _scan_tree(root, recursive)
+					if match(entry.name) and entry.is_file()]
 		except Exception as e:
-			self._log(f"find_files failed: {root} - {e}", False)
+			self._log("find_files failed: %s - %s", root, e, success=False)
 			return []
 
+	def iter_files(self, root: Union[str, Path], pattern: str = "*",
+				   recursive: bool = True) -> Generator[Path, None, None]:
+		"""Lazily yield files matching a name pattern, in the same order as find_files(sort=True)"""
+		# Depth first with every directory sorted by name is already global Path order,
+		# only the directories on the current branch are held in memory
+		match = _name_matcher(pattern)
+		stack = [_sorted_entries(root)]
+		while stack:
+			entry = next(stack[-1], None)
+			if entry is None:
+				stack.pop()
+			elif recursive and entry.is_dir(follow_symlinks=False):
+				stack.append(_sorted_entries(entry.path, skip_denied=True))
+			elif match(entry.name) and entry.is_file():
+				yield Path(entry.path)
+
 	def walk(self, root: Union[str, Path]) -> Generator[tuple, None, None]:
 		"""Walk directory tree (like os.walk but with Path objects)"""
-		root = Path(root)
-		for path in root.rglob('*'):
-			if path.is_dir():
-				dirs = [p for p in path.iterdir() if p.is_dir()]
-				files = [p for p in path.iterdir() if p.is_file()]
-				yield path, dirs, files
+		root = os.fspath(root)
+		# Symlinked directories are listed but not descended into, matching rglob
+		stack = [(root, True)]
+		while stack:
+			current, descend = stack.pop()
+			dirs, files = [], []
+			try:
+				with os.scandir(current) as entries:
+					for entry in entries:
+						if entry.is_dir():
+							dirs.append(Path(entry.path))
+							if descend:
+								stack.append((entry.path, not entry.is_symlink()))
+						elif entry.is_file():
+							files.append(Path(entry.path))
+			except PermissionError:
+				continue
+			if current != root:
+				yield Path(current), dirs, files
 
 	# ========== ARCHIVE OPERATIONS ==========
 
-	def tar_extract(self, archive: Union[str, Path], target_dir: Union[str, Path]) -> bool:
-		"""Extract tar archive"""
+	def tar_extract(self, archive: Union[str, Path], target_dir: Union[str, Path],
+					preserve_mtime: bool = True, extract_filter: Optional[str] = None) -> bool:
+		"""Extract tar archive, extract_filter picks a tarfile filter such as 'data' or 'tar'
+
+		preserve_mtime=False skips restoring member mtimes, one utime() less per file for
+		callers such as rootfs installs that do not need them.
+		"""
 		try:
-			archive, target_dir = Path(archive), Path(target_dir)
-			with tarfile.open(archive) as tar:
-				tar.extractall(target_dir)
-			self._log(f"tar_extract: {archive} -> {target_dir}")
+			archive, target_dir = _as_path(archive), _as_path(target_dir)
+			opener = tarfile.TarFile if preserve_mtime else _NoMtimeTarFile
+			with opener.open(archive, copybufsize=_ARCHIVE_BUFFER) as tar:
+				extract_filter = extract_filter or _TAR_DEFAULT_FILTER
+				if extract_filter:
+					tar.extractall(target_dir, filter=extract_filter)
+				else:
+					tar.extractall(target_dir)
+			self._log("tar_extract: %s -> %s", archive, target_dir)
 			return True
 		except Exception as e:
-			self._log(f"tar_extract failed: {archive} - {e}", False)
+			self._log("tar_extract failed: %s - %s", archive, e, success=False)
 			return False
 
 	def tar_create(self, source: Union[str, Path], archive: Union[str, Path],
-				   compression: str = "") -> bool:
-		"""Create tar archive"""
+				   compression: str = "", numeric_owner: bool = False) -> bool:
+		"""Create tar archive, numeric_owner leaves out the user/group names"""
 		try:
-			source, archive = Path(source), Path(archive)
-			mode = f"w:{compression}" if compression else "w"
-			with tarfile.open(archive, mode) as tar:
-				tar.add(source, arcname=source.name)
-			self._log(f"tar_create: {source} -> {archive}")
+			source, archive = _as_path(source), _as_path(archive)
+			member_filter = _numeric_owner if numeric_owner else None
+			compressor = _parallel_compressor(compression)
+			if compressor:
+				# Stream the tar into a multi-threaded compressor instead of single-core gzip
+				with open(archive, 'wb') as out:
+					process = subprocess.Popen(compressor, stdin=subprocess.PIPE, stdout=out)
+					try:
+						with tarfile.open(fileobj=process.stdin, mode="w|", bufsize=_ARCHIVE_BUFFER) as tar:
+							tar.add(source, arcname=source.name, filter=member_filter)
+					finally:
+						process.stdin.close()
+						returncode = process.wait()
+				if returncode != 0:
+					raise OSError(f"{compressor[0]} exited with status {returncode}")
+			else:
+				# Nothing seeks back while writing, stream mode hands the compressor 1 MiB blocks
+				with tarfile.open(os.fspath(archive), f"w|{compression}", bufsize=_ARCHIVE_BUFFER) as tar:
+					tar.add(source, arcname=source.name, filter=member_filter)
+			self._log("tar_create: %s -> %s", source, archive)
 			return True
 		except Exception as e:
-			self._log(f"tar_create failed: {source} - {e}", False)
+			self._log("tar_create failed: %s - %s", source, e, success=False)
 			return False
 
 	def zip_extract(self, archive: Union[str, Path], target_dir: Union[str, Path]) -> bool:
 		"""Extract zip archive"""
 		try:
-			archive, target_dir = Path(archive), Path(target_dir)
+			archive, target_dir = _as_path(archive), _as_path(target_dir)
 			with zipfile.ZipFile(archive, 'r') as zip_ref:
-				zip_ref.extractall(target_dir)
-			self._log(f"zip_extract: {archive} -> {target_dir}")
+				infos = zip_ref.infolist()
+				files = [info for info in infos if not info.is_dir()]
+				workers = min(_ZIP_WORKERS, os.cpu_count() or 1, len(files))
+				# Directories up front so the workers never race on makedirs
+				parents = {os.fspath(target_dir)}
+				for info in infos:
+					if info.is_dir():
+						_extract_zip_member(zip_ref, info, target_dir)
+					else:
+						parents.add(os.path.dirname(_zip_member_path(target_dir, info.filename)))
+				for parent in parents:
+					os.makedirs(parent, exist_ok=True)
+
+				if workers <= 1:
+					for info in files:
+						_extract_zip_member(zip_ref, info, target_dir)
+				else:
+					# Largest members first onto the least loaded worker
+					buckets = [(0, i, []) for i in range(workers)]
+					for info in sorted(files, key=lambda info: info.compress_size, reverse=True):
+						load, i, chunk = heapq.heappop(buckets)
+						chunk.append(info)
+						heapq.heappush(buckets, (load + info.compress_size, i, chunk))
+
+					with ThreadPoolExecutor(max_workers=workers) as executor:
+						for future in [executor.submit(_extract_zip_chunk, archive, target_dir, chunk)
+									   for _, _, chunk in buckets]:
+							future.result()
+			self._log("zip_extract: %s -> %s", archive, target_dir)
 			return True
 		except Exception as e:
-			self._log(f"zip_extract failed: {archive} - {e}", False)
+			self._log("zip_extract failed: %s - %s", archive, e, success=False)
 			return False
 
-	def zip_create(self, source: Union[str, Path], archive: Union[str, Path]) -> bool:
-		"""Create zip archive"""
+	def zip_create(self, source: Union[str, Path], archive: Union[str, Path],
+				   compresslevel: Optional[int] = None, compression: str = "deflated") -> bool:
+		"""Create zip archive, compresslevel 1 trades some size for much faster deflate"""
 		try:
-			source, archive = Path(source), Path(archive)
-			with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zipf:
+			source, archive = _as_path(source), _as_path(archive)
+			method = _ZIP_METHODS.get(compression.lower())
+			if method is None:
+				raise ValueError(f"unsupported zip compression {compression!r}")
+			with zipfile.ZipFile(archive, 'w', method, allowZip64=True, compresslevel=compresslevel,
+								 strict_timestamps=False) as zipf:
 				if source.is_file():
 					zipf.write(source, source.name)
 				else:
-					for file_path in source.rglob('*'):
-						if file_path.is_file():
-							arcname = file_path.relative_to(source)
-							zipf.write(file_path, arcname)
-			self._log(f"zip_create: {source} -> {archive}")
+					prefix = len(os.path.join(os.fspath(source), ""))
+					for entry in _scan_tree(source):
+						if entry.is_file():
+							# Header from the DirEntry's cached stat, ZipFile.write would stat again
+							# and copy in 8 KiB pieces instead of the 1 MiB buffer
+							stat_info = entry.stat()
+							info = zipfile.ZipInfo(entry.path[prefix:], _zip_date_time(stat_info.st_mtime))
+							info.external_attr = (stat_info.st_mode & 0xFFFF) << 16
+							info.file_size = stat_info.st_size
+							# Recompressing a .xz/.apk/... burns CPU for nothing, store it as is
+							info.compress_type = (zipfile.ZIP_STORED if entry.name.endswith(_PRECOMPRESSED)
+												  else zipf.compression)
+							if compresslevel is not None and info.compress_type != zipfile.ZIP_STORED:
+								# zipf.open ignores the ZipFile's level, zipf.write applies it
+								zipf.write(entry.path, info.filename, compress_type=info.compress_type)
+								continue
+							with open(entry.path, 'rb', buffering=0) as src, zipf.open(info, 'w') as dst:
+								_copy_stream(src, dst)
+			self._log("zip_create: %s -> %s", source, archive)
 			return True
 		except Exception as e:
-			self._log(f"zip_create failed: {source} - {e}", False)
+			self._log("zip_create failed: %s - %s", source, e, success=False)
 			return False
 
 	# ========== CHECKSUM AND HASHING ==========
@@ -971,81 +1918,152 @@ class PyFManager:
 	def checksum(self, path: Union[str, Path], hash_type: str = "sha512") -> Optional[str]:
 		"""Calculate file checksum"""
 		try:
-			path = Path(path)
-			hash_func = getattr(hashlib, hash_type)()
-
-			with open(path, 'rb') as f:
-				for chunk in iter(lambda: f.read(4096), b""):
-					hash_func.update(chunk)
-
-			checksum = hash_func.hexdigest()
-			self._log(f"checksum: {path} -> {checksum[:16]}...")
+			path = _as_path(path)
+			checksum = _hash_file(path, hash_type)
+			self._log("checksum: %s -> %s...", path, checksum[:16])
 			return checksum
 		except Exception as e:
-			self._log(f"checksum failed: {path} - {e}", False)
+			self._log("checksum failed: %s - %s", path, e, success=False)
 			return None
 
+	async def achecksum(self, path: Union[str, Path], hash_type: str = "sha512") -> Optional[str]:
+		"""checksum on the event loop's executor, the hashing itself runs without the GIL"""
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(None, self.checksum, path, hash_type)
+
+	def bulk_checksum(self, paths: List[Union[str, Path]], hash_type: str = "sha512") -> Dict[str, Optional[str]]:
+		"""Checksum many files at once, one pool task per file"""
+		paths = [str(path) for path in paths]
+		sums = dict(zip(paths, self._bulk(self.checksum, paths, [hash_type] * len(paths))))
+		self._log("bulk_checksum: %s files (%s)", len(paths), hash_type)
+		return sums
+
+	def checksum_tree(self, root: Union[str, Path], hash_type: str = "sha512",
+					  pattern: str = "*") -> Dict[str, Optional[str]]:
+		"""Checksum every file under root, reads of one file overlap with hashing of another"""
+		try:
+			files = [str(path) for path in self.iter_files(root, pattern)]
+		except Exception as e:
+			self._log("checksum_tree failed: %s - %s", root, e, success=False)
+			return {}
+		sums = dict(zip(files, self._bulk(self.checksum, files, [hash_type] * len(files))))
+		self._log("checksum_tree: %s (%s files, %s)", root, len(files), hash_type)
+		return sums
+
 	def verify_checksum(self, path: Union[str, Path], expected_hash: str,
 					   hash_type: str = "sha256") -> bool:
 		"""Verify file against expected checksum"""
-		actual_hash = self.checksum(path, hash_type)
-		return actual_hash == expected_hash if actual_hash else False
+		try:
+			# Compare raw digests, no hexdigest string for the file side; bad hex fails before any read
+			expected = bytes.fromhex(expected_hash)
+			matches = hmac.compare_digest(_file_hasher(path, hash_type).digest(), expected)
+			self._log("verify_checksum: %s (%s)", path, hash_type, success=matches)
+			return matches
+		except Exception as e:
+			self._log("verify_checksum failed: %s - %s", path, e, success=False)
+			return False
 
 	# ========== CONTENT OPERATIONS ==========
 
 	def read_text(self, path: Union[str, Path], encoding: str = "utf-8") -> Optional[str]:
 		"""Read text file content"""
 		try:
-			content = Path(path).read_text(encoding=encoding)
-			self._log(f"read_text: {path} ({len(content)} chars)")
+			content = _as_path(path).read_text(encoding=encoding)
+			self._log("read_text: %s (%s chars)", path, len(content))
 			return content
 		except Exception as e:
-			self._log(f"read_text failed: {path} - {e}", False)
+			self._log("read_text failed: %s - %s", path, e, success=False)
 			return None
 
 	def write_text(self, path: Union[str, Path], content: str,
 				   encoding: str = "utf-8") -> bool:
 		"""Write text to file"""
 		try:
-			Path(path).write_text(content, encoding=encoding)
-			self._log(f"write_text: {path} ({len(content)} chars)")
+			_write_file(path, content.encode(encoding))
+			self._log("write_text: %s (%s chars)", path, len(content))
 			return True
 		except Exception as e:
-			self._log(f"write_text failed: {path} - {e}", False)
+			self._log("write_text failed: %s - %s", path, e, success=False)
 			return False
 
-	def read_bytes(self, path: Union[str, Path]) -> Optional[bytes]:
-		"""Read binary file content"""
+	def read_bytes(self, path: Union[str, Path], *,
+				   mmap_threshold: Optional[int] = None) -> Optional[Union[bytes, mmap.mmap]]:
+		"""Read binary file content, as a read-only mmap when it is at least mmap_threshold bytes"""
 		try:
-			content = Path(path).read_bytes()
-			self._log(f"read_bytes: {path} ({len(content)} bytes)")
+			if mmap_threshold:
+				with open(path, 'rb', buffering=0) as f:
+					if os.fstat(f.fileno()).st_size >= mmap_threshold:
+						# Pages fault in on demand, the mapping outlives the closed descriptor
+						content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+						self._log("read_bytes: %s (%s bytes, mapped)", path, len(content))
+						return content
+			content = _as_path(path).read_bytes()
+			self._log("read_bytes: %s (%s bytes)", path, len(content))
 			return content
 		except Exception as e:
-			self._log(f"read_bytes failed: {path} - {e}", False)
+			self._log("read_bytes failed: %s - %s", path, e, success=False)
 			return None
 
 	def write_bytes(self, path: Union[str, Path], content: bytes) -> bool:
 		"""Write bytes to file"""
 		try:
-			Path(path).write_bytes(content)
-			self._log(f"write_bytes: {path} ({len(content)} bytes)")
+			size = _write_file(path, content)
+			self._log("write_bytes: %s (%s bytes)", path, size)
+			return True
+		except Exception as e:
+			self._log("write_bytes failed: %s - %s", path, e, success=False)
+			return False
+
+	def write_bytes_vectored(self, path: Union[str, Path], buffers: Iterable[bytes]) -> bool:
+		"""Write a sequence of buffers with writev, without joining them first"""
+		try:
+			views = [view for view in (memoryview(buf).cast('B') for buf in buffers) if view.nbytes]
+			total = sum(view.nbytes for view in views)
+			if not hasattr(os, "writev"):
+				_as_path(path).write_bytes(b"".join(views))
+			else:
+				fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+				try:
+					index = 0
+					while index < len(views):
+						written = os.writev(fd, views[index:index + _IOV_MAX])
+						# Drop what the kernel took, a short write leaves the head buffer sliced
+						while written:
+							size = views[index].nbytes
+							if written < size:
+								views[index] = views[index][written:]
+								break
+							written -= size
+							index += 1
+				finally:
+					os.close(fd)
+			self._log("write_bytes_vectored: %s (%s bytes, %s buffers)", path, total, len(views))
 			return True
 		except Exception as e:
-			self._log(f"write_bytes failed: {path} - {e}", False)
+			self._log("write_bytes_vectored failed: %s - %s", path, e, success=False)
 			return False
 
 	# ========== TEMPORARY FILES ==========
 
 	def create_temp_file(self, suffix: str = "", prefix: str = "tmp") -> Path:
 		"""Create temporary file"""
-		temp_file = Path(tempfile.mktemp(suffix=suffix, prefix=prefix))
-		self._log(f"create_temp_file: {temp_file}")
+		fd, name = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+		os.close(fd)
+		temp_file = Path(name)
+		self._log("create_temp_file: %s", temp_file)
+		return temp_file
+
+	def open_temp_file(self, mode: str = "w+b", dir: Union[str, Path, None] = None):
+		"""Anonymous temp file, an O_TMPFILE inode on Linux; gone once closed, nothing to clean up"""
+		# TemporaryFile tries O_TMPFILE first and falls back to mkstemp + unlink by itself
+		temp_file = tempfile.TemporaryFile(mode=mode, dir=dir)
+		self._log("open_temp_file: fd %s", temp_file.fileno())
 		return temp_file
 
 	def create_temp_dir(self, suffix: str = "", prefix: str = "tmp") -> Path:
 		"""Create temporary directory"""
 		temp_dir = Path(tempfile.mkdtemp(suffix=suffix, prefix=prefix))
-		self._log(f"create_temp_dir: {temp_dir}")
+		self._log("create_temp_dir: %s", temp_dir)
 		return temp_dir
 
 	# ========== SYMLINK OPERATIONS ==========
@@ -1053,23 +2071,23 @@ class PyFManager:
 	def create_symlink(self, target: Union[str, Path], link_path: Union[str, Path]) -> bool:
 		"""Create symbolic link"""
 		try:
-			target, link_path = Path(target), Path(link_path)
+			target, link_path = _as_path(target), _as_path(link_path)
 			link_path.symlink_to(target)
-			self._log(f"create_symlink: {target} -> {link_path}")
+			self._log("create_symlink: %s -> %s", target, link_path)
 			return True
 		except Exception as e:
-			self._log(f"create_symlink failed: {target} - {e}", False)
+			self._log("create_symlink failed: %s - %s", target, e, success=False)
 			return False
 
 	def read_symlink(self, link_path: Union[str, Path]) -> Optional[Path]:
 		"""Read symbolic link target"""
 		try:
-			link_path = Path(link_path)
-			target = link_path.readlink()
-			self._log(f"read_symlink: {link_path} -> {target}")
+			link_path = _as_path(link_path)
+			target = Path(os.readlink(link_path))
+			self._log("read_symlink: %s -> %s", link_path, target)
 			return target
 		except Exception as e:
-			self._log(f"read_symlink failed: {link_path} - {e}", False)
+			self._log("read_symlink failed: %s - %s", link_path, e, success=False)
 			return None
 
 	# ========== BATCH OPERATIONS ==========
@@ -1077,28 +2095,136 @@ class PyFManager:
 	def bulk_copy(self, sources: List[Union[str, Path]], target_dir: Union[str, Path]) -> bool:
 		"""Copy multiple files to target directory"""
 		try:
-			target_dir = Path(target_dir)
+			target_dir = _as_path(target_dir)
 			target_dir.mkdir(parents=True, exist_ok=True)
 
-			success = True
-			for src in sources:
-				src = Path(src)
-				dst = target_dir / src.name
-				if not self.copy(src, dst):
-					success = False
+			sources = [_as_path(src) for src in sources]
+			targets = [target_dir / src.name for src in sources]
+			if len(set(targets)) == len(targets):
+				success = all(self._bulk(self.copy, sources, targets))
+			else:
+				# Same-named sources overwrite each other, keep the serial last-one-wins order
+				success = all([self.copy(src, dst) for src, dst in zip(sources, targets)])
 
-			self._log(f"bulk_copy: {len(sources)} files -> {target_dir}")
+			self._log("bulk_copy: %s files -> %s", len(sources), target_dir)
 			return success
 		except Exception as e:
-			self._log(f"bulk_copy failed: {e}", False)
+			self._log("bulk_copy failed: %s", e, success=False)
 			return False
 
 	def bulk_remove(self, paths: List[Union[str, Path]]) -> bool:
 		"""Remove multiple files/directories"""
+		if os.unlink not in os.supports_dir_fd:
+			success = all(self._bulk(self.remove, paths))
+		else:
+			# unlinkat relative to one open parent per batch, batches spread over the pool
+			groups = {}
+			for path in paths:
+				parent, name = os.path.split(os.fspath(path).rstrip(os.sep))
+				if name in ("", os.curdir, os.pardir):
+					parent, name = os.fspath(path), None
+				groups.setdefault(parent or os.curdir, []).append(name)
+			batches = [(parent, names[i:i + _DIR_FD_BATCH])
+					   for parent, names in groups.items() for i in range(0, len(names), _DIR_FD_BATCH)]
+			success = all(self._bulk(self._unlink_batch, *zip(*batches))) if batches else True
+
+		self._log("bulk_remove: %s items", len(paths))
+		return success
+
+	def _unlink_batch(self, parent: str, names: List[Optional[str]]) -> bool:
+		"""Unlink names relative to one open parent directory, directories fall back to remove"""
+		try:
+			dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+		except OSError:
+			return all([self.remove(os.path.join(parent, name) if name else parent) for name in names])
+
 		success = True
-		for path in paths:
-			if not self.remove(path):
-				success = False
+		try:
+			for name in names:
+				path = os.path.join(parent, name) if name else parent
+				try:
+					if not name:
+						raise IsADirectoryError
+					os.unlink(name, dir_fd=dir_fd)
+					self._log("remove: %s", path)
+				except FileNotFoundError:
+					self._log("remove: %s", path)
+				except (IsADirectoryError, PermissionError):
+					# EISDIR on Linux, EPERM elsewhere, remove() takes the rmtree path
+					success = self.remove(path) and success
+				except OSError as e:
+					self._log("remove failed: %s - %s", path, e, success=False)
+					success = False
+		finally:
+			os.close(dir_fd)
+		return success
+
+	def bulk_stat(self, paths: List[Union[str, Path]]) -> List[Optional[os.stat_result]]:
+		"""Stat many paths, None for the ones that can't be stated"""
+		if os.stat not in os.supports_dir_fd:
+			return self._bulk(_try_stat, paths)
+
+		# fstatat relative to one open parent per batch, the kernel resolves each prefix once
+		results = [None] * len(paths)
+		groups = {}
+		for index, path in enumerate(paths):
+			parent, name = os.path.split(os.fspath(path))
+			if name:
+				groups.setdefault(parent or os.curdir, []).append((index, name))
+			else:
+				# Empty or trailing-slash paths keep plain stat semantics
+				results[index] = _try_stat(path)
+		batches = [(parent, items[i:i + _DIR_FD_BATCH])
+				   for parent, items in groups.items() for i in range(0, len(items), _DIR_FD_BATCH)]
+
+		for items in self._bulk(self._stat_batch, *zip(*batches)) if batches else []:
+			for index, stat_info in items:
+				results[index] = stat_info
+		self._log("bulk_stat: %s/%s paths", sum(r is not None for r in results), len(paths))
+		return results
+
+	@staticmethod
+	def _stat_batch(parent: str, items: List[tuple]) -> List[tuple]:
+		"""Stat (index, name) items relative to one open parent directory"""
+		try:
+			dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+		except OSError:
+			return [(index, _try_stat(os.path.join(parent, name))) for index, name in items]
+
+		results = []
+		try:
+			for index, name in items:
+				try:
+					results.append((index, os.stat(name, dir_fd=dir_fd)))
+				except (OSError, ValueError):
+					results.append((index, None))
+		finally:
+			os.close(dir_fd)
+		return results
+
+	def bulk_symlink(self, pairs: List[tuple], base_dir: Union[str, Path]) -> bool:
+		"""Create (target, name) symlinks inside base_dir, resolving base_dir only once"""
+		success = True
+		try:
+			use_dir_fd = os.symlink in os.supports_dir_fd
+			dir_fd = os.open(base_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)) if use_dir_fd else None
+		except Exception as e:
+			self._log("bulk_symlink failed: %s - %s", base_dir, e, success=False)
+			return False
+
+		try:
+			for target, name in pairs:
+				try:
+					if dir_fd is not None:
+						os.symlink(os.fspath(target), os.fspath(name), dir_fd=dir_fd)
+					else:
+						os.symlink(os.fspath(target), os.path.join(base_dir, name))
+				except OSError as e:
+					self._log("bulk_symlink failed: %s -> %s - %s", name, target, e, success=False)
+					success = False
+		finally:
+			if dir_fd is not None:
+				os.close(dir_fd)
 
-		self._log(f"bulk_remove: {len(paths)} items")
+		self._log("bulk_symlink: %s links -> %s", len(pairs), base_dir, success=success)
 		return success
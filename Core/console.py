@@ -1,6 +1,7 @@
 import shutil
 import random
 import time
+from functools import lru_cache
 import pyfiglet
 from rich.console import Console
 from rich.table import Table
@@ -15,63 +16,111 @@ class LogLevel(Enum):
     VERBOSE = 2
     DEBUG = 3
 
+# Plain ints so the per-message gate is a single comparison
+_QUIET = LogLevel.QUIET.value
+_NORMAL = LogLevel.NORMAL.value
+_VERBOSE = LogLevel.VERBOSE.value
+_DEBUG = LogLevel.DEBUG.value
+
+_STYLES = {
+    "STATUS": "cyan",
+    "ERROR": "bold red",
+    "WARNING": "yellow",
+    "SUCCESS": "green",
+    "INFO": "blue",
+    "VERBOSE": "dim blue",
+    "DEBUG": "magenta",
+    "QUESTION": "bold yellow",
+}
+_PREFIXES = {tag: f"[{style}][{tag}][/{style}] " for tag, style in _STYLES.items()}
+
+@lru_cache(maxsize=None)
+def _figlet_fonts() -> tuple:
+    # getFonts lists the whole fonts directory, do that once per process
+    return tuple(pyfiglet.FigletFont.getFonts())
+
+@lru_cache(maxsize=32)
+def _figlet(font: str, width: int) -> pyfiglet.Figlet:
+    return pyfiglet.Figlet(font=font, justify="center", width=width)
+
 class console:
     def __init__(self, log_level: LogLevel = LogLevel.NORMAL, time_style: bool = False):
         self.console = Console()
         self.print = self.console.print
         self.log_level = log_level
         self.time_style = time_style
+        self._clock_second = None
+        self._clock_text = ""
+
+    @property
+    def log_level(self) -> LogLevel:
+        return self._log_level
+
+    @log_level.setter
+    def log_level(self, level: LogLevel):
+        self._log_level = level
+        self._lvl = level.value
     
     def set_level(self, level: LogLevel):
         self.log_level = level
 
     def time(self, message: str):
-        if self.time_style:
-            return time.strftime("%I:%M:%S")
-        else:
+        if not self.time_style:
             return message
+        # strftime only when the second changes, bursts of log lines share the string
+        now = int(time.time())
+        if now != self._clock_second:
+            self._clock_second = now
+            self._clock_text = time.strftime("%I:%M:%S", time.localtime(now))
+        return self._clock_text
+
+    def _prefix(self, tag: str) -> str:
+        if self.time_style:
+            style = _STYLES[tag]
+            return f"[{style}][{self.time(tag)}][/{style}] "
+        return _PREFIXES[tag]
 
     def status(self, message: str):
-        if self.log_level.value >= LogLevel.NORMAL.value:
-            self.console.print(f"[cyan][{self.time('STATUS')}][/cyan] {message}")
+        if self._lvl >= _NORMAL:
+            self.console.print(self._prefix('STATUS') + message)
     
     def error(self, message: str):
-        if self.log_level.value >= LogLevel.QUIET.value:
-            self.console.print(f"[bold red][{self.time('ERROR')}][/bold red] {message}")
+        if self._lvl >= _QUIET:
+            self.console.print(self._prefix('ERROR') + message)
     
     def warning(self, message: str):
-        if self.log_level.value >= LogLevel.NORMAL.value:
-            self.console.print(f"[yellow][{self.time('WARNING')}][/yellow] {message}")
+        if self._lvl >= _NORMAL:
+            self.console.print(self._prefix('WARNING') + message)
     
     def success(self, message: str):
-        if self.log_level.value >= LogLevel.NORMAL.value:
-            self.console.print(f"[green][{self.time('SUCCESS')}][/green] {message}")
+        if self._lvl >= _NORMAL:
+            self.console.print(self._prefix('SUCCESS') + message)
     
     def info(self, message: str):
-        if self.log_level.value >= LogLevel.NORMAL.value:
-            self.console.print(f"[blue][{self.time('INFO')}][/blue] {message}")
+        if self._lvl >= _NORMAL:
+            self.console.print(self._prefix('INFO') + message)
     
     def verbose(self, message: str):
-        if self.log_level.value >= LogLevel.VERBOSE.value:
-            self.console.print(f"[dim blue][{self.time('VERBOSE')}][/dim blue] {message}")
+        if self._lvl >= _VERBOSE:
+            self.console.print(self._prefix('VERBOSE') + message)
         
     def debug(self, message: str):
-        if self.log_level.value >= LogLevel.DEBUG.value:
-            self.console.print(f"[magenta][{self.time('DEBUG')}][/magenta] {message}")
+        if self._lvl >= _DEBUG:
+            self.console.print(self._prefix('DEBUG') + message)
     
     def header(self, title: str):
-        if self.log_level.value >= LogLevel.NORMAL.value:
+        if self._lvl >= _NORMAL:
             self.console.print(Panel.fit(f"[bold]{title}[/bold]", border_style="green"))
     
     def divider(self):
-        if self.log_level.value >= LogLevel.NORMAL.value:
+        if self._lvl >= _NORMAL:
             self.console.rule(style="white")
     
     def input(self, message: str):
-        return self.console.input(f"[bold yellow][{self.time('QUESTION')}][/bold yellow] {message}")
+        return self.console.input(self._prefix('QUESTION') + message)
     
     def table(self, data: dict, title: str = ""):
-        if self.log_level.value >= LogLevel.NORMAL.value:
+        if self._lvl >= _NORMAL:
             table = Table(title=title, box=box.ROUNDED)
             table.add_column("Key", style="cyan")
             table.add_column("Value", style="green")
@@ -82,10 +131,9 @@ class console:
             self.console.print(table)
     
     def banner(self):
-        if self.log_level.value >= LogLevel.NORMAL.value:
+        if self._lvl >= _NORMAL:
             width = shutil.get_terminal_size().columns
-            fonts = pyfiglet.Figlet().getFonts()
-            fig = pyfiglet.Figlet(font=random.choice(fonts), justify="center", width=width)
+            fig = _figlet(random.choice(_figlet_fonts()), width)
             logo = fig.renderText(name)
             print(logo)
             d = \
@@ -1,6 +1,8 @@
+import platform
 import re
 import socket
 import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from Core.HiManagers import PyFManager
@@ -9,19 +11,49 @@ from Core.downloader import FileDownloader
 from Core.request import create_session
 from Core.errors_handler import Offline_err
 
+# Simple mapping to only 4 architectures
+_ARCH_MAP = {
+	'aarch64': 'arm64',
+	'arm64': 'arm64',
+	'armv7l': 'arm',
+	'armv6l': 'arm',
+	'armv8l': 'arm64',
+	'i386': 'x86',
+	'i686': 'x86',
+	'x86_64': 'x86_64',
+	'amd64': 'x86_64'
+}
+# The machine cannot change while we run, map it once
+_MACHINE = platform.machine().lower()
+_CURRENT_ARCH = _ARCH_MAP.get(_MACHINE)
+
+# Alpine release files, tarballs first
+_TARBALL_EXTS = ('.tar.gz', '.tar.xz', '.img.gz')
+_ALPINE_EXTS = _TARBALL_EXTS + ('.iso',)
+
+# proot-distro plugin script fields
+_RE_DISTRO_NAME = re.compile(r'DISTRO_NAME="([^"]+)"')
+_RE_DISTRO_COMMENT = re.compile(r'DISTRO_COMMENT="([^"]+)"')
+_RE_TARBALL_URL = re.compile(r"TARBALL_URL\['([^']+)'\]=\"([^\"]+)\"")
+_RE_TARBALL_SHA256 = re.compile(r"TARBALL_SHA256\['([^']+)'\]=\"([^\"]+)\"")
+# Kali rootfs directory listing: <a href="filename">filename</a>, then the row's size cell
+_RE_HREF_TARXZ = re.compile(r'<a href="([^"]+\.tar\.xz)"')
+_RE_SIZE_TD = re.compile(r'<td class="size">([^<]+)</td>')
+
 
 class Distribution(ABC):
 	"""Abstract base class for Linux distributions"""
 
 	def __init__(self, fm: PyFManager, downloader: FileDownloader, console,
-	             resources: str, db, check_storage_func=None, is_offline=None):
+	             resources: str, db, check_storage_func=None, is_offline=None, session=None):
 		self.fm = fm
 		self.downloader = downloader
 		self.console = console
 		self.resources = resources
 		self.db = db
 		self.check_storage = check_storage_func
-		self.session = create_session()
+		# DistributionManager hands every distro the same session, one connection pool per host
+		self.session = session or create_session()
 		self.is_offline_bool = is_offline
 
 	@abstractmethod
@@ -61,27 +93,10 @@ class Distribution(ABC):
 
 	def _get_architecture(self) -> str:
 		"""Get current system architecture mapped to 4 standard types"""
-		import platform
-		machine = platform.machine().lower()
-
-		# Simple mapping to only 4 architectures
-		arch_map = {
-			'aarch64': 'arm64',
-			'arm64': 'arm64',
-			'armv7l': 'arm',
-			'armv6l': 'arm',
-			'armv8l': 'arm64',
-			'i386': 'x86',
-			'i686': 'x86',
-			'x86_64': 'x86_64',
-			'amd64': 'x86_64'
-		}
-
-		arch = arch_map.get(machine)
-		if not arch:
-			raise ValueError(f"Unknown architecture: {machine}. Supported: arm64, arm, x86_64, x86")
+		if not _CURRENT_ARCH:
+			raise ValueError(f"Unknown architecture: {_MACHINE}. Supported: arm64, arm, x86_64, x86")
 
-		return arch
+		return _CURRENT_ARCH
 
 	@abstractmethod
 	def _map_architecture(self, arch: str) -> str:
@@ -148,18 +163,18 @@ class TermuxDistribution(Distribution):
 		}
 
 		# Extract DISTRO_NAME
-		name_match = re.search(r'DISTRO_NAME="([^"]+)"', script_content)
+		name_match = _RE_DISTRO_NAME.search(script_content)
 		if name_match:
 			data['name'] = name_match.group(1)
 
 		# Extract DISTRO_COMMENT
-		comment_match = re.search(r'DISTRO_COMMENT="([^"]+)"', script_content)
+		comment_match = _RE_DISTRO_COMMENT.search(script_content)
 		if comment_match:
 			data['comment'] = comment_match.group(1)
 
 		# Extract TARBALL_URL and TARBALL_SHA256
-		url_matches = re.findall(r"TARBALL_URL\['([^']+)'\]=\"([^\"]+)\"", script_content)
-		sha_matches = re.findall(r"TARBALL_SHA256\['([^']+)'\]=\"([^\"]+)\"", script_content)
+		url_matches = _RE_TARBALL_URL.findall(script_content)
+		sha_matches = _RE_TARBALL_SHA256.findall(script_content)
 
 		# Create tarball dictionary
 		for arch, url in url_matches:
@@ -256,19 +271,20 @@ class TermuxDistribution(Distribution):
 
 
 class DebianDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'arm': 'arm',
+		'x86_64': 'x86_64',
+		'x86': 'i686'
+	}
+
 	def get_name(self) -> str:
 		return "debian"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'arm': 'arm',
-			'x86_64': 'x86_64',
-			'x86': 'i686'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
@@ -276,17 +292,18 @@ class DebianDistribution(TermuxDistribution):
 
 
 class UbuntuDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'arm': 'arm',
+		'x86_64': 'x86_64'
+	}
+
 	def get_name(self) -> str:
 		return "ubuntu"
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'arm': 'arm',
-			'x86_64': 'x86_64'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
@@ -294,105 +311,111 @@ class UbuntuDistribution(TermuxDistribution):
 
 
 class ArchLinuxDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'arm': 'arm',
+		'x86_64': 'x86_64',
+		'x86': 'i686'
+	}
+
 	def get_name(self) -> str:
 		return "archlinux"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'arm': 'arm',
-			'x86_64': 'x86_64',
-			'x86': 'i686'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
 		return super().supports_architecture(termux_arch)
 
 class FedoraDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'x86_64': 'x86_64'
+	}
+
 	def get_name(self) -> str:
 		return "fedora"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'x86_64': 'x86_64'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
 		return super().supports_architecture(termux_arch)
 
 class VoidDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'arm': 'arm',
+		'x86_64': 'x86_64',
+		'x86': 'i686'
+	}
+
 	def get_name(self) -> str:
 		return "void"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'arm': 'arm',
-			'x86_64': 'x86_64',
-			'x86': 'i686'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
 		return super().supports_architecture(termux_arch)
 
 class ManjaroDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64'
+	}
+
 	def get_name(self) -> str:
 		return "manjaro"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
 		return super().supports_architecture(termux_arch)
 
 class ChimeraDistribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'x86_64': 'x86_64'
+	}
+
 	def get_name(self) -> str:
 		return "chimera"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'x86_64': 'x86_64'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
 		return super().supports_architecture(termux_arch)
 
 class OpenSUSE_Distribution(TermuxDistribution):
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'x86_64': 'x86_64'
+	}
+
 	def get_name(self) -> str:
 		return "opensuse"
 
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Termux-specific names"""
-		termux_arch_map = {
-			'arm64': 'aarch64',
-			'x86_64': 'x86_64'
-		}
-		return termux_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		termux_arch = self._map_architecture(arch)
@@ -401,25 +424,27 @@ class OpenSUSE_Distribution(TermuxDistribution):
 class AlpineDistribution(Distribution):
 	"""Alpine Linux distribution"""
 
+	_ARCH_MAP = {
+		'arm64': 'aarch64',
+		'arm': 'armv7',
+		'x86_64': 'x86_64',
+		'x86': 'x86'
+	}
+
 	def __init__(self, fm: PyFManager, downloader: FileDownloader, console,
 	             resources: str, db, check_storage_func=None, **kwargs):
 		super().__init__(fm, downloader, console, resources, db, check_storage_func, **kwargs)
 		self.supported_archs = ['x86_64', 'x86', 'aarch64', 'armv7', 'armhf']
 		self.available_flavors = {}  # Will be populated from metadata
 		self.metadata = None
+		self._metadata_index = {}  # (arch, flavor) -> first tarball item
 
 	def get_name(self) -> str:
 		return "alpine"
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Alpine-specific names"""
-		alpine_arch_map = {
-			'arm64': 'aarch64',
-			'arm': 'armv7',
-			'x86_64': 'x86_64',
-			'x86': 'x86'
-		}
-		return alpine_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		alpine_arch = self._map_architecture(arch)
@@ -473,15 +498,20 @@ class AlpineDistribution(Distribution):
 
 			# Populate available flavors
 			if self.metadata:
+				self._metadata_index = self._index_metadata(self.metadata)
+				available_flavors = self.available_flavors
 				for item in self.metadata:
-					flavor = item.get('flavor', '')
-					if flavor and flavor not in self.available_flavors:
-						self.available_flavors[flavor] = {
-							'title': item.get('title', ''),
-							'desc': item.get('desc', ''),
-							'file_extension': self._get_file_extension(item.get('file', '')),
-							'is_tarball': self._is_tarball(item.get('file', ''))
-						}
+					flavor = item.get('flavor')
+					# First item of a flavor wins, later ones are skipped before any string work
+					if not flavor or flavor in available_flavors:
+						continue
+					file_name = item.get('file', '')
+					available_flavors[flavor] = {
+						'title': item.get('title', ''),
+						'desc': item.get('desc', ''),
+						'file_extension': self._get_file_extension(file_name),
+						'is_tarball': file_name.endswith(_TARBALL_EXTS)
+					}
 
 		except Exception as e:
 			self.console.warning(f"Failed to load Alpine metadata: {e}")
@@ -518,37 +548,35 @@ class AlpineDistribution(Distribution):
 
 	def _get_file_extension(self, filename: str) -> str:
 		"""Extract file extension from filename"""
-		if filename.endswith('.tar.gz'):
-			return '.tar.gz'
-		elif filename.endswith('.tar.xz'):
-			return '.tar.xz'
-		elif filename.endswith('.img.gz'):
-			return '.img.gz'
-		elif filename.endswith('.iso'):
-			return '.iso'
+		for ext in _ALPINE_EXTS:
+			if filename.endswith(ext):
+				return ext
 		return '.tar.gz'  # default
 
 	def _is_tarball(self, filename: str) -> bool:
 		"""Check if file is a tarball (not ISO)"""
-		return any(filename.endswith(ext) for ext in ['.tar.gz', '.tar.xz', '.img.gz'])
+		return filename.endswith(_TARBALL_EXTS)
 
 	def _get_flavor_info(self, distro_type: str) -> Dict[str, str]:
 		"""Get information about a specific Alpine flavor"""
 		self._load_alpine_metadata()
 		return self.available_flavors.get(distro_type, {})
 
+	@staticmethod
+	def _index_metadata(metadata: List[Dict[str, Any]]) -> Dict[tuple, Dict[str, Any]]:
+		"""Map (arch, flavor) to its first tarball item, the one a linear scan would find"""
+		index = {}
+		for item in metadata:
+			if item.get('file', '').endswith(_TARBALL_EXTS):
+				index.setdefault((item.get('arch'), item.get('flavor')), item)
+		return index
+
 	def _find_metadata_for_flavor(self, arch: str, distro_type: str) -> Optional[Dict[str, Any]]:
 		"""Find metadata for specific architecture and flavor"""
 		if not self.metadata:
 			self._load_alpine_metadata()
 
-		if self.metadata:
-			for item in self.metadata:
-				if (item.get('arch') == arch and
-						item.get('flavor') == distro_type and
-						self._is_tarball(item.get('file', ''))):
-					return item
-		return None
+		return self._metadata_index.get((arch, distro_type))
 
 	def get_file_size(self, arch: str, distro_type: str) -> str:
 		"""Get file size for specific architecture and type"""
@@ -660,6 +688,13 @@ class AlpineDistribution(Distribution):
 class KaliNethunterDistribution(Distribution):
 	"""Kali Nethunter distribution implementation"""
 
+	_ARCH_MAP = {
+		'arm64': 'arm64',
+		'arm': 'armhf',
+		'x86_64': 'amd64',
+		'x86': 'i386'
+	}
+
 	def __init__(self, fm: PyFManager, downloader: FileDownloader, console,
 	             resources: str, db, check_storage_func=None, **kwargs):
 		super().__init__(fm, downloader, console, resources, db, check_storage_func, **kwargs)
@@ -673,13 +708,7 @@ class KaliNethunterDistribution(Distribution):
 
 	def _map_architecture(self, arch: str) -> str:
 		"""Map standard architecture to Kali-specific names"""
-		kali_arch_map = {
-			'arm64': 'arm64',
-			'arm': 'armhf',
-			'x86_64': 'amd64',
-			'x86': 'i386'
-		}
-		return kali_arch_map.get(arch, arch)
+		return self._ARCH_MAP.get(arch, arch)
 
 	def supports_architecture(self, arch: str) -> bool:
 		kali_arch = self._map_architecture(arch)
@@ -701,18 +730,23 @@ class KaliNethunterDistribution(Distribution):
 
 	def _parse_html_directory(self, html_content: str) -> Dict[str, str]:
 		"""Parse HTML directory listing to extract file sizes"""
-		import re
 		file_sizes = {}
 
 		try:
-			# Pattern to match file rows: <a href="filename">filename</a> and size
-			pattern = r'<a href="([^"]+\.tar\.xz)"[^>]*>([^<]+)</a>.*?<td class="size">([^<]+)</td>'
-			matches = re.findall(pattern, html_content, re.DOTALL)
-
-			for match in matches:
-				filename = match[0]  # Use the href value as it's more reliable
-				size = match[2].strip()
-				file_sizes[filename] = size
+			# One pass over the lines, pairing each tarball link with the next size cell
+			current_file = None
+			for line in html_content.split('\n'):
+				start = 0
+				if 'tar.xz"' in line:
+					href_match = _RE_HREF_TARXZ.search(line)
+					if href_match:
+						current_file = href_match.group(1)  # Use the href value as it's more reliable
+						start = href_match.end()
+				if current_file and 'class="size"' in line:
+					size_match = _RE_SIZE_TD.search(line, start)
+					if size_match:
+						file_sizes[current_file] = size_match.group(1).strip()
+						current_file = None
 
 			self.console.verbose(f"Parsed {len(file_sizes)} file sizes from directory listing")
 
@@ -883,13 +917,14 @@ class DistributionManager:
 	"""Manager class for handling multiple distributions"""
 
 	def __init__(self, fm: PyFManager, downloader: FileDownloader, console,
-	             resources: str, db, check_storage_func=None):
+	             resources: str, db, check_storage_func=None, session=None):
 		self.fm = fm
 		self.downloader = downloader
 		self.console = console
 		self.resources = resources
 		self.db = db
 		self.check_storage = check_storage_func
+		self.session = session or create_session()
 		self.termux_distros_list_str = [
 			"debian",
 			"ubuntu",
@@ -916,16 +951,25 @@ class DistributionManager:
 
 	@staticmethod
 	def is_connected(host="1.1.1.1", port=53, timeout=2):
-		try:
-			socket.setdefaulttimeout(timeout)
-			socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect((host, port))
-			return True
-		except socket.error:
-			return False
+		# Timeout on this socket only, socket.setdefaulttimeout would change it for every socket
+		with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+			sock.settimeout(timeout)
+			try:
+				sock.connect((host, port))
+				return True
+			except OSError:
+				return False
+
+	def set_offline(self, offline: bool) -> None:
+		"""Switch every distribution to or from offline mode without probing the network again"""
+		self.offline = offline
+		for distro in self.distributions.values():
+			distro.is_offline_bool = offline
 
 	def _initialize_distributions(self) -> Dict[str, Distribution]:
 		"""Initialize all available distributions"""
-		is_offline = not self.is_connected()
+		# Probed once, the distributions share the answer
+		self.offline = is_offline = not self.is_connected()
 		distributions = {}
 
 		# Termux-based distributions
@@ -942,14 +986,23 @@ class DistributionManager:
 			try:
 				distributions[distro_name] = distro_class(
 					self.fm, self.downloader, self.console,
-					self.resources, self.db, self.check_storage, is_offline=is_offline
+					self.resources, self.db, self.check_storage, is_offline=is_offline,
+					session=self.session
 				)
-				# Load data for Termux distributions
-				if distro_name in self.termux_distros_list_str:
-					distributions[distro_name]._load_distro_data()
 			except Exception as e:
 				self.console.warning(f"Failed to initialize {distro_name}: {e}")
 
+		# Load data for Termux distributions, the plugin script fetches overlap instead of queueing
+		termux_loaded = [distributions[distro_name] for distro_name in self.termux_distros_list_str
+		                 if distro_name in distributions]
+		with ThreadPoolExecutor(max_workers=max(1, min(8, len(termux_loaded)))) as executor:
+			futures = {executor.submit(distro._load_distro_data): distro.get_name() for distro in termux_loaded}
+			for future in as_completed(futures):
+				try:
+					future.result()
+				except Exception as e:
+					self.console.warning(f"Failed to initialize {futures[future]}: {e}")
+
 		return distributions
 
 	def get_distribution(self, name: str) -> Optional[Distribution]:
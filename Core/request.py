@@ -2,7 +2,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-def create_session(user_agent: str = None, retries: int = 3, backoff_factor: float = 0.1):
+def create_session(user_agent: str = None, retries: int = 3, backoff_factor: float = 0.1,
+				   pool_connections: int = 4, pool_maxsize: int = 16):
 	"""
 	Create a requests session with custom user agent and retry strategy
 	
@@ -10,6 +11,8 @@ def create_session(user_agent: str = None, retries: int = 3, backoff_factor: flo
 		user_agent (str): Custom user agent string
 		retries (int): Number of retry attempts
 		backoff_factor (float): Backoff factor for retries
+		pool_connections (int): Number of hosts to keep connection pools for
+		pool_maxsize (int): Connections kept alive per host
 	
 	Returns:
 		requests.Session: Configured session object
@@ -34,7 +37,8 @@ def create_session(user_agent: str = None, retries: int = 3, backoff_factor: flo
 		status_forcelist=[429, 500, 502, 503, 504],
 	)
 	
-	adapter = HTTPAdapter(max_retries=retry_strategy)
+	adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_connections,
+						  pool_maxsize=pool_maxsize)
 	session.mount("http://", adapter)
 	session.mount("https://", adapter)
 	
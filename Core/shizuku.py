@@ -1,3 +1,4 @@
+import re
 import sys
 from pathlib import Path
 from rich.markup import escape
@@ -30,7 +31,7 @@ class Rish:
 
 			self.fm.copy(dex_asset, dex_path)
 
-		if not dex_path.exists() or self.fm.checksum(dex_asset) != self.fm.checksum(dex_path):
+		if not dex_path.exists() or self.fm.checksum(dex_asset, "sha256") != self.fm.checksum(dex_path, "sha256"):
 
 			dex_path.chmod(stat.S_IWRITE)
 			self.fm.remove(dex_path)
@@ -44,32 +45,41 @@ class Rish:
 
 		return str(dex_path)
 
-	def rish(self, command: list):
+	def env(self) -> dict:
 		env = os.environ.copy()
 		if not os.environ.get("RISH_APPLICATION_ID") or self.app_id_bool:
 			env['RISH_APPLICATION_ID'] = self.app_id
-		
+		return env
+
+	def loader(self, command: list = None) -> list:
+		# dex() copies and hashes the dex, verify it once rather than on every spawn
+		if self._dex_path is None or not os.path.exists(self._dex_path):
+			self._dex_path = self.dex()
+		return [
+			"/system/bin/app_process",
+			f"-Djava.class.path={self._dex_path}",
+			"/system/bin",
+			"--nice-name=rish",
+			"rikka.shizuku.shell.ShizukuShellLoader"
+		] + (command or [])
+
+	def rish(self, command: list, stdin_data: str = None):
 		result = subprocess.run(
-			[
-				"/system/bin/app_process",
-				f"-Djava.class.path={self.dex()}",
-				"/system/bin",
-				"--nice-name=rish",
-				"rikka.shizuku.shell.ShizukuShellLoader"
-			] + command,
+			self.loader(command),
+			input=stdin_data,
 			capture_output=True,
 			text=True,
-			env=env,
+			env=self.env(),
 			timeout=self.timeout
 		)
 		return result
 
-	def run(self, command_string, timeout=None):
+	def run(self, command_string, timeout=None, stdin_data=None):
 		self.timeout = timeout
 
 		wrapped_cmd = f"{command_string} 2>&1; echo RISH_EXIT_CODE:$?"
 		args = ['-c', wrapped_cmd]
-		result = self.rish(args)
+		result = self.rish(args, stdin_data)
 
 		output = result.stdout + result.stderr
 
@@ -110,7 +120,7 @@ class Rish:
 		result.stdout = clean_output if exit_code == 0 else ""
 		result.stderr = clean_output if exit_code != 0 else ""
 
-		if self.shizuku_not_running_msg in (result.stdout or result.stderr).lower():
+		if self.shizuku_not_running_re.search(result.stdout or result.stderr):
 			result.stderr = result.stdout or result.stderr
 			result.stdout = ""
 			result.returncode = 1
@@ -119,24 +129,24 @@ class Rish:
 
 		return result
 
-	def drun(self, command_string):
+	def run_binary(self, command_string, timeout=None, stdout=None):
+		# With a file object for stdout the output goes straight to it instead of memory
+		return subprocess.run(
+			self.loader(['-c', command_string]),
+			stdout=stdout or subprocess.PIPE,
+			stderr=subprocess.PIPE,
+			env=self.env(),
+			timeout=timeout
+		)
 
-		env = os.environ.copy()
-		if not os.environ.get("RISH_APPLICATION_ID") or self.app_id_bool:
-			env['RISH_APPLICATION_ID'] = self.app_id
+	def drun(self, command_string):
 
 		self.console.debug(f"Executing: {command_string}")
 
 		try:
 			process = subprocess.Popen(
-				[
-					"/system/bin/app_process",
-					f"-Djava.class.path={self.dex()}",
-					"/system/bin",
-					"--nice-name=rish",
-					"rikka.shizuku.shell.ShizukuShellLoader",
-				] + shlex.split(command_string),
-				env=env,
+				self.loader(shlex.split(command_string)),
+				env=self.env(),
 				stdout=None,
 				stderr=None,
 				stdin=None
@@ -185,8 +195,10 @@ class Rish:
 		self.resources = r_path
 		self.assets_path = "Assets"
 		self.shizuku_not_running_msg = "Server is not running".lower()
+		self.shizuku_not_running_re = re.compile(re.escape(self.shizuku_not_running_msg), re.IGNORECASE)
 		self.app_id = app_id
 		self.app_id_bool = app_id_bool
 		self.timeout = None
+		self._dex_path = None
 		self.fm = PyFManager()
 		self.check_rish()
@@ -12,10 +12,12 @@ def template(template_file, output_file=None, **replacements):
 	with open(template_file, 'r', encoding='utf-8') as f:
 		content = f.read()
 	
-	# Replace all occurrences
-	for key, value in replacements.items():
-		pattern = r'\{\{\s*' + re.escape(key) + r'\s*\}\}'
-		content = re.sub(pattern, str(value), content)
+	# Replace all occurrences in one pass, values are inserted literally
+	if replacements:
+		values = {key: str(value) for key, value in replacements.items()}
+		keys = '|'.join(re.escape(key) for key in values)
+		pattern = re.compile(r'\{\{\s*(' + keys + r')\s*\}\}')
+		content = pattern.sub(lambda match: values[match.group(1)], content)
 	
 	# Write the result
 	with open(output_file, 'w', encoding='utf-8') as f:
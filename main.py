@@ -4,6 +4,7 @@
 import argparse
 import os
 import platform
+import shlex
 import sys
 import time
 
@@ -118,7 +119,8 @@ class AndroSH:
 		self.adb = ADBFileManager(self.rish, self.console)
 		self.distro_manager = DistributionManager(self.fm, self.downloader,
 		                                          self.console, self.resources,
-		                                          self.db, self.check_storage
+		                                          self.db, self.check_storage,
+		                                          session=self.request
 		)
 
 
@@ -411,7 +413,8 @@ class AndroSH:
 			self.console.error("Failed to make BusyBox executable")
 			return False
 
-		# Test BusyBox
+		# Test BusyBox, probing again now that the binary is in place
+		self.busybox.reset()
 		if self.busybox.is_available():
 			self.console.success("BusyBox setup completed successfully")
 			return True
@@ -589,7 +592,7 @@ class AndroSH:
 		if len(list_dir) == rootfs_len:
 			self.console.verbose(f"Distro patch: {list_dir}")
 			content = " ".join([str(Path(distro_root_path) / _) for _ in self.busybox.list_dir(distro_root_path, pattern="")])
-			self.busybox._run_command(f"sh -c 'for i in {content}; do mv $i {linux_target}; done'")
+			self.busybox.run(f"sh -c 'for i in {content}; do mv $i {linux_target}; done'")
 			self.busybox.remove(f"{distro_root_path}", recursive=True)
 			self.console.verbose(f"Distro patch successful: {self.busybox.list_dir(linux_target)}")
 
@@ -708,7 +711,7 @@ class AndroSH:
 		file = f"{Path(backup_directory) / backup_name}"
 		compress_flag = 'z' if args.gzip else ''
 		cmd = f"tar -{compress_flag}cf {file} -C {distro_dir} ."
-		result = self.busybox._run_command(cmd)
+		result = self.busybox.run(cmd)
 		if result.returncode != 0:
 			raise AndroSH_err(result.stderr)
 
@@ -755,7 +758,7 @@ class AndroSH:
 		self.console.debug(f"Starting rish shell called with args: {vars(args)}")
 		self.rish_command = args.rish_command
 		if self.rish_command:
-			self.rish.drun(f"-c {repr(self.rish_command)}")
+			self.rish.drun(f"-c {shlex.quote(self.rish_command)}")
 		else:
 			self.rish.drun("-c \"if command -v bash >/dev/null 2>&1; then exec bash; else exec sh; fi\"")
 